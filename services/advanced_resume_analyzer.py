@@ -1,8 +1,20 @@
+import heapq
+import importlib
+import operator
 import os
 import json
 import re
 import sys
+import time
 import traceback
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool, cpu_count
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional, Tuple
 import requests
 from io import BytesIO
@@ -14,164 +26,759 @@ import hashlib
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# PDF processing libraries
-try:
-    import PyPDF2
-    import pdfplumber
-    import fitz  # PyMuPDF for better text extraction
-except ImportError:
-    logger.info("Installing PDF processing libraries...")
-    os.system("pip install PyPDF2 pdfplumber PyMuPDF")
-    import PyPDF2
-    import pdfplumber
-    import fitz
-
-# Text processing libraries
-try:
-    import nltk
-    from nltk.tokenize import word_tokenize, sent_tokenize
-    from nltk.corpus import stopwords
-    from nltk.stem import WordNetLemmatizer
-    from nltk.tag import pos_tag
-    from nltk.chunk import ne_chunk
-    from nltk.tree import Tree
-except ImportError:
-    logger.info("Installing NLTK...")
-    os.system("pip install nltk")
-    import nltk
-    from nltk.tokenize import word_tokenize, sent_tokenize
-    from nltk.corpus import stopwords
-    from nltk.stem import WordNetLemmatizer
-    from nltk.tag import pos_tag
-    from nltk.chunk import ne_chunk
-    from nltk.tree import Tree
-
-# Machine learning libraries for advanced analysis
-try:
-    import spacy
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
-except ImportError:
-    logger.info("Installing ML libraries...")
-    os.system("pip install spacy scikit-learn")
-    import spacy
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
-
-# Download required NLTK data
-required_nltk_data = ['punkt', 'stopwords', 'wordnet', 'averaged_perceptron_tagger', 'maxent_ne_chunker', 'words']
-for data in required_nltk_data:
+# Precompiled patterns (module scope so each literal is parsed once per process)
+_CLEAN_WS = re.compile(r'\s+')
+_ALLOWED_CHARS = re.compile(r'[^\w\s\.\,\-\@$$$$\[\]\{\}\/\\\:\;\!\?\$\%\&\*\+\=\<\>\|\~\`\'\"]')
+_PAGE_MARKER = re.compile(r'--- Page \d+ ---')
+_TABLE_MARKER = re.compile(r'--- Table \d+ on Page \d+ ---')
+_JUNK_LINE = re.compile(r'(?m)^.{0,2}$\n?')
+_MOSTLY_SPECIAL = re.compile(r'(?m)^(?:[^\w\s]{2,}|\W*)$\n?')
+_WORD_RE = re.compile(r'\b\w+\b')
+_SKILL_YEARS = re.compile(r'(\d+)\+?\s*(?:years?|yrs?)')
+
+# Length-preserving normalization shared by the scan text and the skill keys:
+# '-' and '.' map to spaces so one key covers "node.js", "node js" and
+# "ci-cd" style spellings without per-skill variant expansion. The strip
+# table yields the compact spelling ("nodejs", "machinelearning").
+_SCAN_NORM = str.maketrans('-.', '  ')
+_SKILL_STRIP = str.maketrans('', '', ' -.')
+
+_SECTION_PATTERNS = {
+    'contact': re.compile(r'(email|phone|address|linkedin|github)', re.IGNORECASE),
+    'summary': re.compile(r'(summary|objective|profile|about)', re.IGNORECASE),
+    'experience': re.compile(r'(experience|employment|work history|professional)', re.IGNORECASE),
+    'education': re.compile(r'(education|degree|university|college|school)', re.IGNORECASE),
+    'skills': re.compile(r'(skills|technologies|competencies|expertise)', re.IGNORECASE),
+    'projects': re.compile(r'(projects|portfolio|work samples)', re.IGNORECASE),
+    'certifications': re.compile(r'(certifications|certificates|licenses)', re.IGNORECASE),
+    'awards': re.compile(r'(awards|achievements|honors|recognition)', re.IGNORECASE)
+}
+
+# Single alternations so the text is scanned once, not per pattern
+_YEAR_RE = re.compile(
+    r'(?P<years>\d+)\+?\s*(?:years?|yrs?)'
+    r'(?:\s*(?:of\s*)?(?:experience|exp)|\s*in\s*(?:software|development|programming))?'
+    r'|(?:over|more\s+than)\s+(?P<years_about>\d+)\s*years?'
+)
+
+_LEADERSHIP_RE = re.compile(
+    r'led\s+(?:a\s+)?team\s+of\s+(?P<led>\d+)'
+    r'|managed\s+(?P<managed>\d+)\s+(?:developers|engineers|people)'
+    r'|mentored\s+(?P<mentored>\d+)'
+    r'|supervised\s+(?P<supervised>\d+)'
+    r'|coordinated\s+with\s+(?P<coordinated>\d+)'
+)
+
+# Indicator keywords per technology stack, compiled into one alternation
+# each so scoring a stack is a single scan over the flattened skill list
+_STACK_KEYWORDS = {
+    'web_fullstack': ('javascript', 'react', 'angular', 'vue', 'node.js', 'html', 'css'),
+    'data_science': ('python', 'pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'r'),
+    'mobile': ('react native', 'flutter', 'swift', 'kotlin', 'ios', 'android'),
+    'devops': ('docker', 'kubernetes', 'jenkins', 'terraform', 'ansible', 'aws', 'azure')
+}
+_STACK_PATTERNS = {name: re.compile('|'.join(map(re.escape, keywords)))
+                   for name, keywords in _STACK_KEYWORDS.items()}
+
+# Security-relevant certification terms, shared by the role gate and renderer
+_SECURITY_TERMS = frozenset({'security', 'cissp', 'cism', 'cisa'})
+
+# Required-skill tuples for the role templates, hoisted so each call
+# reuses one constant instead of building a fresh list
+_REQ_SWE_JUNIOR = ('programming', 'version control')
+_REQ_SWE_MID = ('programming', 'system design', 'databases')
+_REQ_SWE_SENIOR = ('architecture', 'leadership', 'mentoring')
+_REQ_DATA_SCIENTIST = ('python', 'statistics', 'sql')
+_REQ_DEVOPS = ('docker', 'kubernetes', 'cloud')
+_REQ_FRONTEND = ('javascript', 'react', 'css')
+_REQ_BACKEND = ('programming', 'databases', 'api')
+_REQ_FULLSTACK = ('frontend', 'backend', 'databases')
+_REQ_MOBILE = ('mobile', 'programming')
+_REQ_SECURITY = ('security', 'networking')
+
+# Frontend framework tokens, matched exactly against SkillsIndex.token_set
+_FRONTEND_FRAMEWORKS = frozenset({'react', 'angular', 'vue'})
+
+# Score-to-grade and skill-count buckets, indexed with bisect_right instead
+# of walking an if/elif ladder
+_GRADE_THRESHOLDS = (55, 60, 65, 70, 75, 80, 85, 90)
+_GRADE_LABELS = ('C-', 'C', 'C+', 'B-', 'B', 'B+', 'A-', 'A', 'A+')
+_TECH_SKILL_THRESHOLDS = (5, 10, 15)
+_TECH_SKILL_POINTS = (10, 20, 25, 30)
+
+# Integer codes for the scoring kernel so it only sees primitives
+_LEVEL_CODES = {'entry': 0, 'mid': 1, 'senior': 2}
+_LENGTH_CODES = {'too_short': 0, 'appropriate': 1, 'too_long': 2}
+_EXTRACTION_POINTS = {'excellent': 5, 'good': 3, 'basic': 1}
+
+# Strength/improvement prose, indexed by the bit position the kernel sets;
+# list order here defines the order the notes appear in the breakdown
+_STRENGTH_NOTES = (
+    'Excellent technical skill diversity',
+    'Good technical skill range',
+    'Leadership experience demonstrated',
+    'Quantifiable achievements included',
+    'Professional certifications listed',
+    'Portfolio/project links included',
+)
+_IMPROVEMENT_NOTES = (
+    'Limited technical skills listed',
+    'Resume may be too lengthy',
+    'Resume lacks sufficient detail',
+    'Add quantifiable achievements',
+    'Include more soft skills',
+    'PDF format may need optimization',
+)
+_I_PDF_FORMAT = 1 << 5
+
+
+@lru_cache(maxsize=4096)
+def _score_components(total_technical_skills: int, level_code: int, has_leadership: bool,
+                      confidence: int, section_count: int, length_code: int, has_quant: bool,
+                      has_certs: bool, has_portfolio: bool, num_soft_skills: int) -> Tuple[int, ...]:
+    """Pure integer scoring kernel behind calculate_overall_score.
+
+    Takes only primitives and returns (technical, experience, structure,
+    achievements, completeness, total, strengths_mask, improvements_mask);
+    the caller maps the input dicts down to ints and materializes the masks
+    against _STRENGTH_NOTES/_IMPROVEMENT_NOTES.
+    """
+    strengths_mask = 0
+    improvements_mask = 0
+
+    bucket = bisect_right(_TECH_SKILL_THRESHOLDS, total_technical_skills)
+    technical = _TECH_SKILL_POINTS[bucket]
+    if bucket == 3:
+        strengths_mask |= 1
+    elif bucket == 2:
+        strengths_mask |= 1 << 1
+    elif bucket == 0:
+        improvements_mask |= 1
+
+    experience = 15
+    if level_code == 2:
+        experience += 10
+    elif level_code == 1:
+        experience += 5
+    if has_leadership:
+        experience += 5
+        strengths_mask |= 1 << 2
+    if confidence > 80:
+        experience += 5
+    experience = min(experience, 25)
+
+    structure = section_count * 3
+    if length_code == 1:
+        structure += 5
+    elif length_code == 2:
+        improvements_mask |= 1 << 1
+    elif length_code == 0:
+        improvements_mask |= 1 << 2
+
+    structure = min(structure, 20)
+
+    if has_quant:
+        achievements = 15
+        strengths_mask |= 1 << 3
+    else:
+        achievements = 5
+        improvements_mask |= 1 << 3
+
+    completeness = 0
+    if has_certs:
+        completeness += 3
+        strengths_mask |= 1 << 4
+    if has_portfolio:
+        completeness += 4
+        strengths_mask |= 1 << 5
+    if num_soft_skills >= 3:
+        completeness += 3
+    else:
+        improvements_mask |= 1 << 4
+
+    total = min(technical + experience + structure + achievements + completeness, 100)
+    return (technical, experience, structure, achievements, completeness, total,
+            strengths_mask, improvements_mask)
+
+# Static interview-question templates, built once instead of per call.
+# Plain dicts (not proxies) so the returned list stays JSON-serializable;
+# nothing in the pipeline mutates them.
+_SYSTEM_DESIGN_QUESTIONS = (
+    {
+        'question': 'Design a scalable system for a social media platform that handles millions of users.',
+        'category': 'System Design',
+        'difficulty': 'Hard',
+        'skill_focus': 'Architecture',
+        'follow_up': 'How would you handle data consistency and caching?'
+    },
+    {
+        'question': 'How would you approach optimizing a slow-performing database query?',
+        'category': 'Technical',
+        'difficulty': 'Medium',
+        'skill_focus': 'Database Optimization',
+        'follow_up': 'What tools would you use to identify performance bottlenecks?'
+    }
+)
+_BEHAVIORAL_QUESTIONS = (
+    {
+        'question': 'Tell me about a time when you had to learn a new technology quickly for a project.',
+        'category': 'Behavioral',
+        'difficulty': 'Medium',
+        'skill_focus': 'Adaptability',
+        'follow_up': 'How do you typically approach learning new technologies?'
+    },
+    {
+        'question': 'Describe a challenging bug you encountered and how you debugged it.',
+        'category': 'Behavioral',
+        'difficulty': 'Medium',
+        'skill_focus': 'Problem Solving',
+        'follow_up': 'What debugging strategies do you find most effective?'
+    },
+    {
+        'question': 'How do you handle disagreements with team members about technical decisions?',
+        'category': 'Behavioral',
+        'difficulty': 'Medium',
+        'skill_focus': 'Communication',
+        'follow_up': 'Can you give an example of when you changed your mind based on feedback?'
+    }
+)
+_LEADERSHIP_QUESTIONS = (
+    {
+        'question': 'How do you mentor junior developers and help them grow?',
+        'category': 'Leadership',
+        'difficulty': 'Medium',
+        'skill_focus': 'Mentoring',
+        'follow_up': 'What\'s the most rewarding mentoring experience you\'ve had?'
+    },
+    {
+        'question': 'Describe how you would handle a situation where your team is behind schedule on a critical project.',
+        'category': 'Leadership',
+        'difficulty': 'Hard',
+        'skill_focus': 'Project Management',
+        'follow_up': 'How do you balance quality with delivery deadlines?'
+    }
+)
+_SITUATIONAL_QUESTIONS = (
+    {
+        'question': 'How would you approach debugging a production issue that\'s affecting users?',
+        'category': 'Situational',
+        'difficulty': 'Medium',
+        'skill_focus': 'Incident Response',
+        'follow_up': 'What steps would you take to prevent similar issues in the future?'
+    },
+    {
+        'question': 'If you had to choose between delivering a feature on time with technical debt or delaying for a cleaner implementation, what would you do?',
+        'category': 'Situational',
+        'difficulty': 'Hard',
+        'skill_focus': 'Decision Making',
+        'follow_up': 'How do you communicate technical trade-offs to non-technical stakeholders?'
+    }
+)
+_DATA_SCIENCE_QUESTION = {
+    'question': 'Explain the difference between supervised and unsupervised learning with examples.',
+    'category': 'Technical',
+    'difficulty': 'Medium',
+    'skill_focus': 'Machine Learning',
+    'follow_up': 'When would you choose one approach over the other?'
+}
+_CLOUD_QUESTION = {
+    'question': 'How would you design a cloud architecture for high availability and disaster recovery?',
+    'category': 'Technical',
+    'difficulty': 'Hard',
+    'skill_focus': 'Cloud Architecture',
+    'follow_up': 'What are the cost implications of your design choices?'
+}
+
+# Shared role-template fields; read-only so every generator can alias one
+# instance instead of rebuilding the same four-key dict per call
+_BASE_ROLE_SOFTWARE = MappingProxyType({
+    'category': 'Software Engineering',
+    'remote_friendly': True,
+    'growth_potential': 'High',
+    'market_demand': 'Very High'
+})
+
+_BASE_ROLE_DATA_SCIENCE = MappingProxyType({
+    'category': 'Data Science',
+    'remote_friendly': True,
+    'growth_potential': 'Very High',
+    'market_demand': 'High'
+})
+
+_BASE_ROLE_DEVOPS = MappingProxyType({
+    'category': 'DevOps/Infrastructure',
+    'remote_friendly': True,
+    'growth_potential': 'High',
+    'market_demand': 'Very High'
+})
+
+_BASE_ROLE_FRONTEND = MappingProxyType({
+    'category': 'Frontend Development',
+    'remote_friendly': True,
+    'growth_potential': 'High',
+    'market_demand': 'High'
+})
+
+_BASE_ROLE_BACKEND = MappingProxyType({
+    'category': 'Backend Development',
+    'remote_friendly': True,
+    'growth_potential': 'High',
+    'market_demand': 'Very High'
+})
+
+_BASE_ROLE_FULLSTACK = MappingProxyType({
+    'category': 'Full-Stack Development',
+    'remote_friendly': True,
+    'growth_potential': 'Very High',
+    'market_demand': 'Very High'
+})
+
+_BASE_ROLE_MOBILE = MappingProxyType({
+    'category': 'Mobile Development',
+    'remote_friendly': True,
+    'growth_potential': 'High',
+    'market_demand': 'High'
+})
+
+_BASE_ROLE_SECURITY = MappingProxyType({
+    'category': 'Cybersecurity',
+    'remote_friendly': True,
+    'growth_potential': 'Very High',
+    'market_demand': 'Very High'
+})
+
+# Seniority keywords as word-bounded alternations: one scan of the resume
+# per level, and the anchors stop "senior" matching inside "seniority"
+_SENIOR_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, (
+    'senior', 'lead', 'principal', 'architect', 'manager', 'director',
+    'head of', 'vp', 'cto', 'chief', 'team lead', 'technical lead',
+    'staff engineer', 'distinguished engineer'))) + r')\b')
+_MID_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, (
+    'mid-level', 'intermediate', 'software engineer ii', 'engineer ii',
+    'associate', 'specialist'))) + r')\b')
+
+# Quantifiable-achievement and portfolio-link predicates as single union
+# patterns: one pass over the text instead of one per alternative, and
+# IGNORECASE replaces the per-call text.lower() copy
+_ACHIEVEMENT_RE = re.compile('|'.join((
+    r'\d+%',  # Percentages
+    r'increased.*?\d+',
+    r'improved.*?\d+',
+    r'reduced.*?\d+',
+    r'saved.*?\$\d+',
+    r'generated.*?\$\d+',
+    r'managed.*?\$\d+',
+    r'led.*?team.*?\d+',
+    r'supervised.*?\d+'
+)), re.IGNORECASE)
+_LINK_RE = re.compile('|'.join((
+    r'github\.com',
+    r'gitlab\.com',
+    r'portfolio',
+    r'project.*?link',
+    r'demo.*?link',
+    r'live.*?site'
+)), re.IGNORECASE)
+
+# Resume-structure checks collapsed into one tagged alternation; the named
+# group that matched tells analyze_resume_structure which flag to set
+_STRUCTURE_RE = re.compile(
+    r'(?P<has_contact_info>email|phone|linkedin|github)'
+    r'|(?P<has_summary>summary|objective|profile|about)'
+    r'|(?P<has_experience>experience|employment|work history)'
+    r'|(?P<has_education>education|degree|university|college)'
+    r'|(?P<has_skills_section>skills|technologies|competencies)'
+)
+_STRUCTURE_FLAGS = ('has_contact_info', 'has_summary', 'has_experience',
+                    'has_education', 'has_skills_section')
+_FRONTEND_RE = re.compile(r'react|angular|vue')
+_MOBILE_RE = _STACK_PATTERNS['mobile']
+
+# Comprehensive skill databases (shared by every analyzer instance)
+_SKILL_DATABASE = {
+    'programming_languages': {
+        'python': ['python', 'py', 'django', 'flask', 'fastapi', 'pandas', 'numpy'],
+        'javascript': ['javascript', 'js', 'node.js', 'nodejs', 'react', 'vue', 'angular'],
+        'java': ['java', 'spring', 'hibernate', 'maven', 'gradle'],
+        'c++': ['c++', 'cpp', 'c plus plus'],
+        'c#': ['c#', 'csharp', 'c sharp', '.net', 'asp.net'],
+        'php': ['php', 'laravel', 'symfony', 'codeigniter'],
+        'ruby': ['ruby', 'rails', 'ruby on rails'],
+        'go': ['golang', 'go lang'],
+        'rust': ['rust', 'cargo'],
+        'swift': ['swift', 'ios'],
+        'kotlin': ['kotlin', 'android'],
+        'scala': ['scala', 'akka'],
+        'typescript': ['typescript', 'ts'],
+        'r': ['r programming', 'r language'],
+        'matlab': ['matlab', 'simulink'],
+        'perl': ['perl'],
+        'shell': ['bash', 'shell scripting', 'powershell'],
+        'sql': ['sql', 'mysql', 'postgresql', 'sqlite', 'oracle', 'sql server']
+    },
+    'web_technologies': {
+        'frontend': ['html', 'css', 'sass', 'less', 'bootstrap', 'tailwind', 'material-ui', 'chakra-ui'],
+        'backend': ['express', 'koa', 'fastify', 'spring boot', 'django rest', 'flask api'],
+        'frameworks': ['react', 'angular', 'vue', 'svelte', 'ember', 'backbone'],
+        'mobile': ['react native', 'flutter', 'ionic', 'xamarin', 'cordova'],
+        'cms': ['wordpress', 'drupal', 'joomla', 'contentful', 'strapi']
+    },
+    'databases': {
+        'relational': ['mysql', 'postgresql', 'sqlite', 'oracle', 'sql server', 'mariadb'],
+        'nosql': ['mongodb', 'cassandra', 'couchdb', 'neo4j', 'dynamodb'],
+        'cache': ['redis', 'memcached', 'elasticsearch'],
+        'data_warehouse': ['snowflake', 'bigquery', 'redshift', 'databricks']
+    },
+    'cloud_platforms': {
+        'aws': ['aws', 'amazon web services', 'ec2', 's3', 'lambda', 'rds', 'cloudformation'],
+        'azure': ['azure', 'microsoft azure', 'azure functions', 'azure sql'],
+        'gcp': ['gcp', 'google cloud', 'google cloud platform', 'app engine', 'cloud functions'],
+        'others': ['heroku', 'digitalocean', 'linode', 'vultr', 'vercel', 'netlify']
+    },
+    'devops_tools': {
+        'containerization': ['docker', 'kubernetes', 'podman', 'containerd'],
+        'ci_cd': ['jenkins', 'github actions', 'gitlab ci', 'travis ci', 'circleci', 'azure devops'],
+        'infrastructure': ['terraform', 'ansible', 'puppet', 'chef', 'cloudformation'],
+        'monitoring': ['prometheus', 'grafana', 'elk stack', 'splunk', 'datadog', 'new relic'],
+        'version_control': ['git', 'github', 'gitlab', 'bitbucket', 'svn']
+    },
+    'data_science': {
+        'libraries': ['pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras'],
+        'visualization': ['matplotlib', 'seaborn', 'plotly', 'bokeh', 'd3.js'],
+        'big_data': ['spark', 'hadoop', 'kafka', 'airflow', 'dask'],
+        'ml_ops': ['mlflow', 'kubeflow', 'sagemaker', 'azure ml']
+    },
+    'security': {
+        'tools': ['nmap', 'wireshark', 'metasploit', 'burp suite', 'owasp'],
+        'concepts': ['penetration testing', 'vulnerability assessment', 'encryption', 'ssl/tls']
+    },
+    'testing': {
+        'frameworks': ['jest', 'mocha', 'pytest', 'junit', 'selenium', 'cypress'],
+        'types': ['unit testing', 'integration testing', 'e2e testing', 'performance testing']
+    }
+}
+
+# One bit per top-level category, so "does this resume touch category X"
+# becomes a bitwise AND against a mask built during extraction
+_CAT_BITS = {category: 1 << i for i, category in enumerate(_SKILL_DATABASE)}
+
+_SOFT_SKILLS = [
+    'leadership', 'communication', 'teamwork', 'problem solving', 'critical thinking',
+    'project management', 'time management', 'adaptability', 'creativity', 'collaboration',
+    'analytical skills', 'decision making', 'conflict resolution', 'mentoring', 'coaching',
+    'public speaking', 'presentation skills', 'negotiation', 'customer service',
+    'strategic thinking', 'innovation', 'emotional intelligence', 'stress management'
+]
+
+_CERTIFICATIONS = [
+    'aws certified', 'azure certified', 'google cloud certified', 'cissp', 'cism', 'cisa',
+    'pmp', 'scrum master', 'agile', 'itil', 'comptia', 'cisco certified', 'microsoft certified',
+    'oracle certified', 'salesforce certified', 'kubernetes certified'
+]
+
+# Proper capitalization for skill names that plain Title Case gets wrong
+_SKILL_DISPLAY_NAMES = {
+    'javascript': 'JavaScript',
+    'typescript': 'TypeScript',
+    'nodejs': 'Node.js',
+    'reactjs': 'React.js',
+    'vuejs': 'Vue.js',
+    'angularjs': 'Angular.js',
+    'mysql': 'MySQL',
+    'postgresql': 'PostgreSQL',
+    'mongodb': 'MongoDB',
+    'aws': 'AWS',
+    'gcp': 'Google Cloud Platform',
+    'html': 'HTML',
+    'css': 'CSS',
+    'sql': 'SQL',
+    'api': 'API',
+    'rest': 'REST',
+    'graphql': 'GraphQL',
+    'docker': 'Docker',
+    'kubernetes': 'Kubernetes',
+    'jenkins': 'Jenkins',
+    'git': 'Git',
+    'github': 'GitHub',
+    'gitlab': 'GitLab',
+    'jira': 'JIRA',
+    'ci/cd': 'CI/CD',
+    'devops': 'DevOps',
+    'mlops': 'MLOps',
+    'tensorflow': 'TensorFlow',
+    'pytorch': 'PyTorch',
+    'scikit-learn': 'Scikit-learn',
+    'pandas': 'Pandas',
+    'numpy': 'NumPy'
+}
+
+def _format_skill_name(skill: str) -> str:
+    """Format skill names with proper capitalization"""
+    return _SKILL_DISPLAY_NAMES.get(skill.lower(), skill.title())
+
+# Optional third-party dependencies, imported on first use via _lazy_import.
+# The module no longer self-installs anything at import time; run bootstrap()
+# from the deploy pipeline to fetch packages and data files ahead of time.
+PyPDF2 = None
+pdfplumber = None
+fitz = None  # PyMuPDF for better text extraction
+nltk = None
+spacy = None
+ahocorasick = None
+rapidfuzz = None
+orjson = None
+
+def _lazy_import(name: str):
+    """Import an optional dependency on first use and cache it at module scope"""
+    module = globals().get(name)
+    if module is None:
+        module = importlib.import_module(name)
+        globals()[name] = module
+    return module
+
+def _dumps_sorted(payload: Dict) -> bytes:
+    """Serialize a dict to key-sorted JSON bytes, via orjson when available.
+
+    Used for cache fingerprints, where only stability matters; the stdlib
+    encoder is the fallback when orjson is not installed.
+    """
     try:
-        nltk.data.find(f'tokenizers/{data}')
+        orjson = _lazy_import('orjson')
+    except ImportError:
+        orjson = None
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)
+    return json.dumps(payload, sort_keys=True, default=str).encode()
+
+def bootstrap() -> None:
+    """One-time environment setup for deployments.
+
+    Installs the optional dependencies and data files that older revisions
+    fetched implicitly at import time. Run from the deploy pipeline, never
+    from request-serving code.
+    """
+    os.system("pip install PyPDF2 pdfplumber PyMuPDF nltk spacy pyahocorasick")
+    os.system("python -m spacy download en_core_web_sm")
+    nltk = _lazy_import('nltk')
+    for dataset in ('stopwords', 'wordnet'):
+        nltk.download(dataset, quiet=True)
+
+@lru_cache(maxsize=1)
+def _build_skill_index() -> Tuple['ahocorasick.Automaton', 'ahocorasick.Automaton', Dict]:
+    """Build the skill and keyword automatons once per process.
+
+    Every AdvancedResumeAnalyzer() shares the same automatons, so web workers
+    that construct an analyzer per request pay the O(skills) build cost once.
+    """
+    ahocorasick = _lazy_import('ahocorasick')
+
+    variant_entries = {}
+    for category, subcategories in _SKILL_DATABASE.items():
+        for subcategory, skills in subcategories.items():
+            for skill in skills:
+                formatted_skill = _format_skill_name(skill)
+                variants = {
+                    skill.translate(_SCAN_NORM),
+                    skill.translate(_SKILL_STRIP)
+                }
+                for variant in variants:
+                    if variant:
+                        variant_entries.setdefault(variant, []).append(
+                            (category, subcategory, skill, formatted_skill))
+
+    skill_automaton = ahocorasick.Automaton()
+    for variant, entries in variant_entries.items():
+        skill_automaton.add_word(variant, (len(variant), entries))
+    skill_automaton.make_automaton()
+
+    phrase_entries = {}
+    for skill in _SOFT_SKILLS:
+        phrase_entries.setdefault(skill, []).append(('soft_skills', skill.title()))
+    for cert in _CERTIFICATIONS:
+        phrase_entries.setdefault(cert, []).append(('certifications', cert.title()))
+
+    keyword_automaton = ahocorasick.Automaton()
+    for phrase, entries in phrase_entries.items():
+        keyword_automaton.add_word(phrase, (len(phrase), entries))
+    keyword_automaton.make_automaton()
+
+    return skill_automaton, keyword_automaton, variant_entries
+
+@lru_cache(maxsize=1)
+def _stack_keyword_automaton() -> 'ahocorasick.Automaton':
+    """Automaton over every stack indicator keyword, tagged with its stacks.
+
+    One pass over the flattened skills scores all stacks at once instead of
+    one regex scan per stack.
+    """
+    ahocorasick = _lazy_import('ahocorasick')
+    entries = {}
+    for stack, keywords in _STACK_KEYWORDS.items():
+        for keyword in keywords:
+            entries.setdefault(keyword, []).append(stack)
+
+    automaton = ahocorasick.Automaton()
+    for keyword, stacks in entries.items():
+        automaton.add_word(keyword, (keyword, tuple(stacks)))
+    automaton.make_automaton()
+    return automaton
+
+@lru_cache(maxsize=64)
+def _required_skills_automaton(required_skills: Tuple[str, ...]) -> 'ahocorasick.Automaton':
+    """Automaton over one required-skills tuple, cached across calls.
+
+    The role templates pass the same small literal lists on every analysis,
+    so the build cost is paid once per distinct list for the process.
+    """
+    ahocorasick = _lazy_import('ahocorasick')
+    automaton = ahocorasick.Automaton()
+    for required_skill in required_skills:
+        automaton.add_word(required_skill.lower(), required_skill)
+    automaton.make_automaton()
+    return automaton
+
+def _ensure_nltk_data(name: str) -> bool:
+    """Fetch an NLTK dataset on first use instead of at import time"""
+    nltk = _lazy_import('nltk')
+    try:
+        nltk.data.find(f'corpora/{name}')
+        return True
     except LookupError:
         try:
-            nltk.download(data, quiet=True)
+            return nltk.download(name, quiet=True)
         except Exception as e:
-            logger.warning(f"Could not download {data}: {e}")
+            logger.warning("Could not download %s: %s", name, e)
+            return False
+
+@lru_cache(maxsize=1)
+def _get_stopwords() -> frozenset:
+    """English stopwords as a cached frozenset, built on first use"""
+    if not _ensure_nltk_data('stopwords'):
+        return frozenset()
+    try:
+        from nltk.corpus import stopwords
+        return frozenset(stopwords.words('english'))
+    except Exception as e:
+        logger.warning("NLTK stopwords unavailable: %s", e)
+        return frozenset()
+
+@lru_cache(maxsize=1)
+def _get_nlp():
+    """Load a minimal spaCy pipeline once, shared across analyzer instances.
+
+    Only sentence boundaries and the document language are consumed, so the
+    tagger, parser, NER, lemmatizer and attribute ruler are excluded and a
+    sentencizer supplies sentence splits.
+    """
+    try:
+        spacy = _lazy_import('spacy')
+        nlp = spacy.load("en_core_web_sm",
+                         exclude=["ner", "lemmatizer", "attribute_ruler", "tagger", "parser"])
+        nlp.add_pipe("sentencizer")
+        return nlp
+    except Exception as e:
+        logger.warning("Could not load spaCy model (run bootstrap() to install it): %s", e)
+        return None
+
+@dataclass(frozen=True)
+class SkillsIndex:
+    """Flattened views of a skills_analysis dict.
+
+    The role generators and match scoring all need the same flat skill lists;
+    building them once per analysis replaces a dozen walks over the nested
+    technical_skills structure.
+    """
+    all_lower: Tuple[str, ...]
+    all_lower_set: frozenset
+    token_set: frozenset  # individual words of every skill, for exact-token gates
+    by_category: Dict[str, Tuple[str, ...]]
+    flat: Tuple[Tuple[str, str, str], ...]  # (category, subcategory, skill_lower)
+    joined: str        # every skill (incl. soft skills and certs), lowercase
+    tech_joined: str   # technical skills only, lowercase
+
+    @classmethod
+    def build(cls, skills_analysis: Dict) -> 'SkillsIndex':
+        flat = []
+        by_category = {}
+        for category, subcategories in skills_analysis['technical_skills'].items():
+            category_skills = []
+            for subcategory, skills in subcategories.items():
+                category_skills.extend(skills)
+                flat.extend((category, subcategory, skill.lower()) for skill in skills)
+            by_category[category] = tuple(category_skills)
+
+        tech_lower = [skill_lower for _, _, skill_lower in flat]
+        all_lower = list(tech_lower)
+        all_lower.extend(skill.lower() for skill in skills_analysis['soft_skills'])
+        all_lower.extend(skill.lower() for skill in skills_analysis['certifications'])
+        all_lower = tuple(all_lower)
+
+        token_set = frozenset(token for skill in all_lower
+                              for token in _WORD_RE.findall(skill))
+
+        return cls(all_lower, frozenset(all_lower), token_set, by_category,
+                   tuple(flat), "\n".join(all_lower), "\n".join(tech_lower))
+
+def _web_tech_lower(index: SkillsIndex) -> str:
+    return "\n".join(skill.lower() for skill in index.by_category.get('web_technologies', ()))
+
+# Role gates, evaluated against the cached SkillsIndex before the matching
+# renderer is called; order matches the old generator sequence
+_ROLE_SPECS = (
+    ('software_engineer', lambda sa, index: True),
+    # O(1) token hit first; the containment scan only runs for resumes
+    # that spell Python/R inside a longer skill name
+    ('data_scientist', lambda sa, index: 'python' in index.token_set or any(
+        'python' in skill.lower() or 'r' in skill.lower()
+        for skill in (*sa.get('programming_languages', []),
+                      *index.by_category.get('data_science', ())))),
+    ('devops_engineer', lambda sa, index: bool(
+        index.by_category.get('devops_tools') or index.by_category.get('cloud_platforms'))),
+    ('frontend_developer', lambda sa, index: not _FRONTEND_FRAMEWORKS.isdisjoint(index.token_set)),
+    ('backend_developer', lambda sa, index: bool(
+        sa['programming_languages'] or sa['databases'])),
+    ('fullstack_developer', lambda sa, index: bool(
+        sa['programming_languages'] and sa['databases'])
+        and not _FRONTEND_FRAMEWORKS.isdisjoint(index.token_set)),
+    ('mobile_developer', lambda sa, index: _MOBILE_RE.search(_web_tech_lower(index)) is not None),
+    ('security_engineer', lambda sa, index: bool(
+        index.by_category.get('security')
+        or any(term in cert.lower() for cert in sa['certifications']
+               for term in _SECURITY_TERMS)))
+)
 
 class AdvancedResumeAnalyzer:
     def __init__(self):
         self.openai_api_key = os.getenv('NEXT_PUBLIC_OPENAI_API_KEY')
         self.huggingface_api_key = os.getenv('NEXT_PUBLIC_HUGGINGFACE_API_KEY')
         
-        # Initialize NLP components
+        # Initialize NLP components (corpora are fetched lazily on first use)
+        self.stop_words = _get_stopwords()
         try:
+            from nltk.stem import WordNetLemmatizer
             self.lemmatizer = WordNetLemmatizer()
-            self.stop_words = set(stopwords.words('english'))
         except Exception as e:
-            logger.warning(f"NLTK initialization failed: {e}")
+            logger.warning("NLTK initialization failed: %s", e)
             self.lemmatizer = None
-            self.stop_words = set()
         
-        # Try to load spaCy model
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            logger.info("Installing spaCy English model...")
-            os.system("python -m spacy download en_core_web_sm")
-            try:
-                self.nlp = spacy.load("en_core_web_sm")
-            except Exception as e:
-                logger.warning(f"Could not load spaCy model: {e}")
-                self.nlp = None
+        # Shared minimal spaCy pipeline (loaded once per process)
+        self.nlp = _get_nlp()
+
+        # Content-hash cache of PDF extraction results for repeat uploads
+        self._pdf_cache: 'OrderedDict[str, Tuple[str, Dict[str, Any]]]' = OrderedDict()
+        self._pdf_cache_size = int(os.getenv('RESUME_PDF_CACHE_SIZE', '64'))
+
+        # Fingerprint cache of job recommendations; the same resume analyzed
+        # twice (page refresh, re-upload) skips the whole dispatch pipeline
+        self._recommendation_cache: 'OrderedDict[bytes, List[Dict[str, Any]]]' = OrderedDict()
+        self._recommendation_cache_size = 128
         
         # Comprehensive skill databases
-        self.skill_database = {
-            'programming_languages': {
-                'python': ['python', 'py', 'django', 'flask', 'fastapi', 'pandas', 'numpy'],
-                'javascript': ['javascript', 'js', 'node.js', 'nodejs', 'react', 'vue', 'angular'],
-                'java': ['java', 'spring', 'hibernate', 'maven', 'gradle'],
-                'c++': ['c++', 'cpp', 'c plus plus'],
-                'c#': ['c#', 'csharp', 'c sharp', '.net', 'asp.net'],
-                'php': ['php', 'laravel', 'symfony', 'codeigniter'],
-                'ruby': ['ruby', 'rails', 'ruby on rails'],
-                'go': ['golang', 'go lang'],
-                'rust': ['rust', 'cargo'],
-                'swift': ['swift', 'ios'],
-                'kotlin': ['kotlin', 'android'],
-                'scala': ['scala', 'akka'],
-                'typescript': ['typescript', 'ts'],
-                'r': ['r programming', 'r language'],
-                'matlab': ['matlab', 'simulink'],
-                'perl': ['perl'],
-                'shell': ['bash', 'shell scripting', 'powershell'],
-                'sql': ['sql', 'mysql', 'postgresql', 'sqlite', 'oracle', 'sql server']
-            },
-            'web_technologies': {
-                'frontend': ['html', 'css', 'sass', 'less', 'bootstrap', 'tailwind', 'material-ui', 'chakra-ui'],
-                'backend': ['express', 'koa', 'fastify', 'spring boot', 'django rest', 'flask api'],
-                'frameworks': ['react', 'angular', 'vue', 'svelte', 'ember', 'backbone'],
-                'mobile': ['react native', 'flutter', 'ionic', 'xamarin', 'cordova'],
-                'cms': ['wordpress', 'drupal', 'joomla', 'contentful', 'strapi']
-            },
-            'databases': {
-                'relational': ['mysql', 'postgresql', 'sqlite', 'oracle', 'sql server', 'mariadb'],
-                'nosql': ['mongodb', 'cassandra', 'couchdb', 'neo4j', 'dynamodb'],
-                'cache': ['redis', 'memcached', 'elasticsearch'],
-                'data_warehouse': ['snowflake', 'bigquery', 'redshift', 'databricks']
-            },
-            'cloud_platforms': {
-                'aws': ['aws', 'amazon web services', 'ec2', 's3', 'lambda', 'rds', 'cloudformation'],
-                'azure': ['azure', 'microsoft azure', 'azure functions', 'azure sql'],
-                'gcp': ['gcp', 'google cloud', 'google cloud platform', 'app engine', 'cloud functions'],
-                'others': ['heroku', 'digitalocean', 'linode', 'vultr', 'vercel', 'netlify']
-            },
-            'devops_tools': {
-                'containerization': ['docker', 'kubernetes', 'podman', 'containerd'],
-                'ci_cd': ['jenkins', 'github actions', 'gitlab ci', 'travis ci', 'circleci', 'azure devops'],
-                'infrastructure': ['terraform', 'ansible', 'puppet', 'chef', 'cloudformation'],
-                'monitoring': ['prometheus', 'grafana', 'elk stack', 'splunk', 'datadog', 'new relic'],
-                'version_control': ['git', 'github', 'gitlab', 'bitbucket', 'svn']
-            },
-            'data_science': {
-                'libraries': ['pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras'],
-                'visualization': ['matplotlib', 'seaborn', 'plotly', 'bokeh', 'd3.js'],
-                'big_data': ['spark', 'hadoop', 'kafka', 'airflow', 'dask'],
-                'ml_ops': ['mlflow', 'kubeflow', 'sagemaker', 'azure ml']
-            },
-            'security': {
-                'tools': ['nmap', 'wireshark', 'metasploit', 'burp suite', 'owasp'],
-                'concepts': ['penetration testing', 'vulnerability assessment', 'encryption', 'ssl/tls']
-            },
-            'testing': {
-                'frameworks': ['jest', 'mocha', 'pytest', 'junit', 'selenium', 'cypress'],
-                'types': ['unit testing', 'integration testing', 'e2e testing', 'performance testing']
-            }
-        }
+        self.skill_database = _SKILL_DATABASE
         
-        self.soft_skills = [
-            'leadership', 'communication', 'teamwork', 'problem solving', 'critical thinking',
-            'project management', 'time management', 'adaptability', 'creativity', 'collaboration',
-            'analytical skills', 'decision making', 'conflict resolution', 'mentoring', 'coaching',
-            'public speaking', 'presentation skills', 'negotiation', 'customer service',
-            'strategic thinking', 'innovation', 'emotional intelligence', 'stress management'
-        ]
+        self.soft_skills = _SOFT_SKILLS
         
-        self.certifications = [
-            'aws certified', 'azure certified', 'google cloud certified', 'cissp', 'cism', 'cisa',
-            'pmp', 'scrum master', 'agile', 'itil', 'comptia', 'cisco certified', 'microsoft certified',
-            'oracle certified', 'salesforce certified', 'kubernetes certified'
-        ]
+        self.certifications = _CERTIFICATIONS
         
         # Industry-specific job roles and requirements
         self.job_market_data = {
@@ -228,7 +835,36 @@ class AdvancedResumeAnalyzer:
             }
         }
 
+        # Precompiled Aho-Corasick automatons shared across instances
+        self.skill_automaton, self.keyword_automaton, self.skill_variants = _build_skill_index()
+
+    @staticmethod
+    def _is_word_boundary(text: str, start: int, end: int) -> bool:
+        """Python-level \\b check for an automaton match spanning [start, end)"""
+        if start > 0 and (text[start - 1].isalnum() or text[start - 1] == '_'):
+            return False
+        if end < len(text) and (text[end].isalnum() or text[end] == '_'):
+            return False
+        return True
+
     def extract_text_from_pdf(self, pdf_bytes: bytes) -> Tuple[str, Dict[str, Any]]:
+        """Extract text from PDF, short-circuiting repeat uploads via a content-hash cache"""
+        key = hashlib.sha256(pdf_bytes).hexdigest()
+        cached = self._pdf_cache.get(key)
+        if cached is not None:
+            self._pdf_cache.move_to_end(key)
+            logger.info("PDF extraction cache hit for %s", key[:12])
+            return cached
+
+        result = self._extract_text_from_pdf(pdf_bytes)
+
+        self._pdf_cache[key] = result
+        while len(self._pdf_cache) > self._pdf_cache_size:
+            self._pdf_cache.popitem(last=False)
+
+        return result
+
+    def _extract_text_from_pdf(self, pdf_bytes: bytes) -> Tuple[str, Dict[str, Any]]:
         """Extract text from PDF using multiple methods with detailed metadata"""
         extraction_metadata = {
             'methods_tried': [],
@@ -239,84 +875,108 @@ class AdvancedResumeAnalyzer:
         }
         
         text = ""
-        
+
         # Method 1: PyMuPDF (fitz) - Best for complex layouts
         try:
             logger.info("Attempting text extraction with PyMuPDF...")
             extraction_metadata['methods_tried'].append('pymupdf')
-            
+
+            fitz = _lazy_import('fitz')
             pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
-            extraction_metadata['page_count'] = pdf_document.page_count
-            
-            for page_num in range(pdf_document.page_count):
-                page = pdf_document.load_page(page_num)
-                page_text = page.get_text()
-                if page_text.strip():
-                    text += f"\n--- Page {page_num + 1} ---\n{page_text}"
-            
-            pdf_document.close()
-            
+            try:
+                extraction_metadata['page_count'] = pdf_document.page_count
+
+                parts = []
+                for page_num in range(pdf_document.page_count):
+                    page = pdf_document.load_page(page_num)
+                    page_text = page.get_text()
+                    if page_text.strip():
+                        parts.append(f"\n--- Page {page_num + 1} ---\n{page_text}")
+            finally:
+                pdf_document.close()
+
+            text = "".join(parts)
             if len(text.strip()) > 200:
                 extraction_metadata['successful_method'] = 'pymupdf'
                 extraction_metadata['extraction_quality'] = 'excellent'
-                logger.info(f"PyMuPDF: Successfully extracted {len(text)} characters")
+                logger.info("PyMuPDF: Successfully extracted %d characters", len(text))
                 return text, extraction_metadata
-                
+
         except Exception as e:
             error_msg = f"PyMuPDF extraction failed: {str(e)}"
             logger.warning(error_msg)
             extraction_metadata['errors'].append(error_msg)
-        
+
         # Method 2: pdfplumber - Good for tables and structured data
-        try:
-            logger.info("Attempting text extraction with pdfplumber...")
-            extraction_metadata['methods_tried'].append('pdfplumber')
-            
-            with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
-                extraction_metadata['page_count'] = len(pdf.pages)
-                
-                for page_num, page in enumerate(pdf.pages):
-                    # Extract text
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += f"\n--- Page {page_num + 1} ---\n{page_text}"
-                    
-                    # Extract tables if any
-                    tables = page.extract_tables()
-                    for table_num, table in enumerate(tables):
-                        text += f"\n--- Table {table_num + 1} on Page {page_num + 1} ---\n"
-                        for row in table:
-                            if row:
-                                text += " | ".join([cell or "" for cell in row]) + "\n"
-            
-            if len(text.strip()) > 200:
-                extraction_metadata['successful_method'] = 'pdfplumber'
-                extraction_metadata['extraction_quality'] = 'good'
-                logger.info(f"pdfplumber: Successfully extracted {len(text)} characters")
-                return text, extraction_metadata
-                
-        except Exception as e:
-            error_msg = f"pdfplumber extraction failed: {str(e)}"
-            logger.warning(error_msg)
-            extraction_metadata['errors'].append(error_msg)
-        
+        # (skipped when PyMuPDF opened the document but found no pages, since
+        # pdfplumber shares the same underlying failure mode)
+        if extraction_metadata['page_count'] != 0 or 'pymupdf' not in extraction_metadata['methods_tried'] or extraction_metadata['errors']:
+            try:
+                logger.info("Attempting text extraction with pdfplumber...")
+                extraction_metadata['methods_tried'].append('pdfplumber')
+
+                pdfplumber = _lazy_import('pdfplumber')
+                with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+                    extraction_metadata['page_count'] = len(pdf.pages)
+
+                    parts = []
+                    for page_num, page in enumerate(pdf.pages):
+                        # Extract text
+                        page_text = page.extract_text()
+                        if page_text:
+                            parts.append(f"\n--- Page {page_num + 1} ---\n{page_text}")
+
+                        # Extract tables if any
+                        tables = page.extract_tables()
+                        for table_num, table in enumerate(tables):
+                            if not any(any(row) for row in table):
+                                continue
+                            parts.append(f"\n--- Table {table_num + 1} on Page {page_num + 1} ---\n"
+                                         + "\n".join(" | ".join(cell or "" for cell in row)
+                                                     for row in table if row) + "\n")
+
+                        # pdfplumber caches per-page layout objects for the
+                        # lifetime of the document; drop them as we go so a
+                        # large PDF does not hold every page in memory at once
+                        getattr(page, 'flush_cache', lambda: None)()
+                        getattr(getattr(page, 'get_textmap', None),
+                                'cache_clear', lambda: None)()
+
+                text = "".join(parts)
+                if len(text.strip()) > 200:
+                    extraction_metadata['successful_method'] = 'pdfplumber'
+                    extraction_metadata['extraction_quality'] = 'good'
+                    logger.info("pdfplumber: Successfully extracted %d characters", len(text))
+                    return text, extraction_metadata
+
+            except Exception as e:
+                error_msg = f"pdfplumber extraction failed: {str(e)}"
+                logger.warning(error_msg)
+                extraction_metadata['errors'].append(error_msg)
+
         # Method 3: PyPDF2 - Basic extraction
         try:
             logger.info("Attempting text extraction with PyPDF2...")
             extraction_metadata['methods_tried'].append('pypdf2')
-            
+
+            PyPDF2 = _lazy_import('PyPDF2')
             pdf_reader = PyPDF2.PdfReader(BytesIO(pdf_bytes))
             extraction_metadata['page_count'] = len(pdf_reader.pages)
-            
+
+            parts = []
             for page_num, page in enumerate(pdf_reader.pages):
                 page_text = page.extract_text()
                 if page_text:
-                    text += f"\n--- Page {page_num + 1} ---\n{page_text}"
-            
+                    parts.append(f"\n--- Page {page_num + 1} ---\n{page_text}")
+
+            text = "".join(parts)
+            # PdfReader keeps every parsed page object alive; drop the
+            # reference before returning so the pages can be collected
+            del pdf_reader
             if len(text.strip()) > 100:
                 extraction_metadata['successful_method'] = 'pypdf2'
                 extraction_metadata['extraction_quality'] = 'basic'
-                logger.info(f"PyPDF2: Successfully extracted {len(text)} characters")
+                logger.info("PyPDF2: Successfully extracted %d characters", len(text))
                 return text, extraction_metadata
                 
         except Exception as e:
@@ -343,7 +1003,7 @@ class AdvancedResumeAnalyzer:
                 text = cleaned_text
                 extraction_metadata['successful_method'] = 'raw_bytes'
                 extraction_metadata['extraction_quality'] = 'poor'
-                logger.info(f"Raw extraction: Found {len(readable_words)} readable words")
+                logger.info("Raw extraction: Found %d readable words", len(readable_words))
                 return text, extraction_metadata
                 
         except Exception as e:
@@ -356,8 +1016,8 @@ class AdvancedResumeAnalyzer:
         logger.error("All text extraction methods failed")
         return "", extraction_metadata
 
-    def preprocess_text(self, text: str) -> Dict[str, Any]:
-        """Advanced text preprocessing with detailed analysis"""
+    def _clean_text(self, text: str) -> Dict[str, Any]:
+        """Regex cleaning and structural analysis shared by single and batch preprocessing"""
         preprocessing_info = {
             'original_length': len(text),
             'cleaned_length': 0,
@@ -370,8 +1030,8 @@ class AdvancedResumeAnalyzer:
         }
         
         # Basic cleaning
-        text = re.sub(r'\s+', ' ', text)  # Normalize whitespace
-        text = re.sub(r'[^\w\s\.\,\-\@$$$$\[\]\{\}\/\\\:\;\!\?\$\%\&\*\+\=\<\>\|\~\`\'\"]', ' ', text)
+        text = _CLEAN_WS.sub(' ', text)  # Normalize whitespace
+        text = _ALLOWED_CHARS.sub(' ', text)
         
         # Detect and fix encoding issues
         try:
@@ -381,52 +1041,22 @@ class AdvancedResumeAnalyzer:
             text = text.encode('utf-8', errors='ignore').decode('utf-8')
         
         # Remove page markers and artifacts
-        text = re.sub(r'--- Page \d+ ---', '', text)
-        text = re.sub(r'--- Table \d+ on Page \d+ ---', '', text)
-        
-        # Split into lines and clean
-        lines = text.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            # Remove very short lines (likely artifacts)
-            if len(line) > 2:
-                # Remove lines that are mostly special characters
-                if len(re.sub(r'[^\w\s]', '', line)) > len(line) * 0.3:
-                    cleaned_lines.append(line)
-        
-        cleaned_text = '\n'.join(cleaned_lines)
-        preprocessing_info['cleaned_length'] = len(cleaned_text)
-        
-        # Analyze text structure
-        if self.nlp:
-            try:
-                doc = self.nlp(cleaned_text[:1000000])  # Limit for performance
-                preprocessing_info['sentences'] = len(list(doc.sents))
-                preprocessing_info['languages_detected'] = [doc.lang_]
-            except Exception as e:
-                logger.warning(f"spaCy analysis failed: {e}")
+        text = _PAGE_MARKER.sub('', text)
+        text = _TABLE_MARKER.sub('', text)
         
+        # Drop very short lines and lines that carry no word characters in two
+        # multiline substitutions instead of a Python-level loop per line
+        cleaned_text = _MOSTLY_SPECIAL.sub('', _JUNK_LINE.sub('', text)).strip()
+        preprocessing_info['cleaned_length'] = len(cleaned_text)
+
         # Basic word analysis
-        words = re.findall(r'\b\w+\b', cleaned_text.lower())
+        words = _WORD_RE.findall(cleaned_text.lower())
         preprocessing_info['words'] = len(words)
         preprocessing_info['unique_words'] = len(set(words))
-        
+
         # Detect resume sections
-        section_patterns = {
-            'contact': r'(email|phone|address|linkedin|github)',
-            'summary': r'(summary|objective|profile|about)',
-            'experience': r'(experience|employment|work history|professional)',
-            'education': r'(education|degree|university|college|school)',
-            'skills': r'(skills|technologies|competencies|expertise)',
-            'projects': r'(projects|portfolio|work samples)',
-            'certifications': r'(certifications|certificates|licenses)',
-            'awards': r'(awards|achievements|honors|recognition)'
-        }
-        
-        for section, pattern in section_patterns.items():
-            if re.search(pattern, cleaned_text, re.IGNORECASE):
+        for section, pattern in _SECTION_PATTERNS.items():
+            if pattern.search(cleaned_text):
                 preprocessing_info['sections_detected'].append(section)
         
         return {
@@ -434,7 +1064,76 @@ class AdvancedResumeAnalyzer:
             'preprocessing_info': preprocessing_info
         }
 
-    def extract_comprehensive_skills(self, text: str) -> Dict[str, Any]:
+    @staticmethod
+    def _split_for_nlp(text: str, max_chars: int = 200000) -> List[str]:
+        """Split cleaned text into bounded chunks, preferring line boundaries"""
+        if len(text) <= max_chars:
+            return [text] if text else []
+
+        chunks = []
+        start = 0
+        length = len(text)
+        while start < length:
+            end = min(start + max_chars, length)
+            if end < length:
+                newline = text.rfind('\n', start, end)
+                if newline > start:
+                    end = newline + 1
+            chunks.append(text[start:end])
+            start = end
+        return chunks
+
+    def _analyze_doc_structure(self, result: Dict[str, Any], docs) -> None:
+        """Fill sentence/language fields from the processed spaCy docs of one text"""
+        sentences = 0
+        language = None
+        for doc in docs:
+            sentences += sum(1 for _ in doc.sents)
+            if language is None:
+                language = doc.lang_
+
+        preprocessing_info = result['preprocessing_info']
+        preprocessing_info['sentences'] = sentences
+        if language is not None:
+            preprocessing_info['languages_detected'] = [language]
+
+    def preprocess_text(self, text: str) -> Dict[str, Any]:
+        """Advanced text preprocessing with detailed analysis"""
+        result = self._clean_text(text)
+
+        # Analyze text structure, streaming bounded chunks instead of truncating
+        if self.nlp:
+            try:
+                chunks = self._split_for_nlp(result['cleaned_text'])
+                self._analyze_doc_structure(result, self.nlp.pipe(chunks, batch_size=8))
+            except Exception as e:
+                logger.warning("spaCy analysis failed: %s", e)
+
+        return result
+
+    def preprocess_texts(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Batch variant of preprocess_text; spaCy inference is amortized via nlp.pipe"""
+        results = [self._clean_text(text) for text in texts]
+
+        if self.nlp:
+            batch_size = int(os.getenv("RESUME_SPACY_BATCH", "32"))
+            chunks = []
+            chunk_counts = []
+            for result in results:
+                result_chunks = self._split_for_nlp(result['cleaned_text'])
+                chunks.extend(result_chunks)
+                chunk_counts.append(len(result_chunks))
+
+            try:
+                docs = self.nlp.pipe(chunks, batch_size=batch_size)
+                for result, count in zip(results, chunk_counts):
+                    self._analyze_doc_structure(result, islice(docs, count))
+            except Exception as e:
+                logger.warning("spaCy batch analysis failed: %s", e)
+
+        return results
+
+    def extract_comprehensive_skills(self, text: str, text_lower: Optional[str] = None) -> Dict[str, Any]:
         """Extract skills with advanced pattern matching and categorization"""
         skills_analysis = {
             'technical_skills': {},
@@ -450,147 +1149,168 @@ class AdvancedResumeAnalyzer:
             'years_of_experience': {}
         }
         
-        text_lower = text.lower()
-        
-        # Extract technical skills with context
+        text_lower = text_lower or text.lower()
+        # Apply the same length-preserving normalization the skill keys use,
+        # so match offsets still map 1:1 onto `text`.
+        scan_text = text_lower.translate(_SCAN_NORM)
+        if not scan_text.isascii():
+            # Force a compact 1-byte representation: a single non-ASCII character
+            # upgrades the whole string to UCS-2/UCS-4 and doubles or quadruples
+            # the bytes every scan below has to move. '?' replacements are
+            # single characters, so offsets still map 1:1 onto `text`.
+            scan_text = scan_text.encode('ascii', errors='replace').decode('ascii')
+
+        # Single automaton pass over the text collecting every skill match with offsets
+        found_by_home = {}                  # (category, subcategory) -> ordered skill names
+        category_flat = defaultdict(list)   # category -> flat skill names (with dups)
+        match_offsets = defaultdict(list)   # formatted skill -> [(start, end)]
+        total_skills = 0
+
+        for end_index, (length, entries) in self.skill_automaton.iter(scan_text):
+            start = end_index - length + 1
+            end = end_index + 1
+            if not self._is_word_boundary(scan_text, start, end):
+                continue
+
+            seen_names = set()
+            for category, subcategory, skill, formatted_skill in entries:
+                found_skills = found_by_home.setdefault((category, subcategory), [])
+                if formatted_skill not in found_skills:
+                    found_skills.append(formatted_skill)
+                    category_flat[category].append(formatted_skill)
+                    total_skills += 1
+                if formatted_skill not in seen_names:
+                    seen_names.add(formatted_skill)
+                    match_offsets[formatted_skill].append((start, end))
+
+        # Fuzzy second pass: resumes write "postgres" or "dockers" where the
+        # database says "postgresql" / "docker"; rapidfuzz catches those
+        # near-misses without a Python-level string comparison loop.
+        fuzzy_skills = set()
+        try:
+            rapidfuzz = _lazy_import('rapidfuzz')
+        except ImportError:
+            rapidfuzz = None
+        if rapidfuzz is not None:
+            unknown_tokens = {}
+            for word_match in _WORD_RE.finditer(scan_text):
+                token = word_match.group()
+                if (len(token) >= 4 and not token.isdigit()
+                        and token not in self.skill_variants
+                        and token not in unknown_tokens):
+                    unknown_tokens[token] = (word_match.start(), word_match.end())
+            known_variants = list(self.skill_variants)
+            for token, span in unknown_tokens.items():
+                best = rapidfuzz.process.extractOne(
+                    token, known_variants,
+                    scorer=rapidfuzz.fuzz.ratio, score_cutoff=90)
+                if best is None:
+                    continue
+                for category, subcategory, skill, formatted_skill in self.skill_variants[best[0]]:
+                    found_skills = found_by_home.setdefault((category, subcategory), [])
+                    if formatted_skill not in found_skills:
+                        found_skills.append(formatted_skill)
+                        category_flat[category].append(formatted_skill)
+                        total_skills += 1
+                    if formatted_skill not in match_offsets:
+                        fuzzy_skills.add(formatted_skill)
+                        match_offsets[formatted_skill].append(span)
+
+        # Locate every "N years" mention once instead of re-scanning per skill
+        year_mentions = [(match.start(), int(match.group(1)))
+                         for match in _SKILL_YEARS.finditer(scan_text)]
+        year_positions = [position for position, _ in year_mentions]
+
+        # Rebuild the category -> subcategory structure in database order
         for category, subcategories in self.skill_database.items():
             skills_analysis['technical_skills'][category] = {}
-            
-            for subcategory, skills in subcategories.items():
-                found_skills = []
-                
-                for skill in skills:
-                    # Create multiple search patterns
-                    patterns = [
-                        rf'\b{re.escape(skill)}\b',
-                        rf'\b{re.escape(skill.replace(" ", ""))}\b',
-                        rf'\b{re.escape(skill.replace("-", " "))}\b',
-                        rf'\b{re.escape(skill.replace(".", ""))}\b'
-                    ]
-                    
-                    for pattern in patterns:
-                        matches = list(re.finditer(pattern, text_lower))
-                        if matches:
-                            formatted_skill = self.format_skill_name(skill)
-                            if formatted_skill not in found_skills:
-                                found_skills.append(formatted_skill)
-                                
-                                # Calculate confidence score based on frequency and context
-                                confidence = min(len(matches) * 10 + 50, 95)
-                                skills_analysis['skill_confidence_scores'][formatted_skill] = confidence
-                                
-                                # Extract context around skill mentions
-                                contexts = []
-                                for match in matches[:3]:  # Limit to first 3 contexts
-                                    start = max(0, match.start() - 50)
-                                    end = min(len(text), match.end() + 50)
-                                    context = text[start:end].strip()
-                                    contexts.append(context)
-                                
-                                skills_analysis['skill_context'][formatted_skill] = contexts
-                                
-                                # Try to extract years of experience
-                                years = self.extract_skill_experience(text, skill)
-                                if years:
-                                    skills_analysis['years_of_experience'][formatted_skill] = years
-                            break
-                
+            for subcategory in subcategories:
+                found_skills = found_by_home.get((category, subcategory))
                 if found_skills:
                     skills_analysis['technical_skills'][category][subcategory] = found_skills
-        
-        # Extract soft skills
-        for skill in self.soft_skills:
-            if re.search(rf'\b{re.escape(skill)}\b', text_lower):
-                formatted_skill = skill.title()
-                skills_analysis['soft_skills'].append(formatted_skill)
-        
-        # Extract certifications
-        for cert in self.certifications:
-            if re.search(rf'\b{re.escape(cert)}\b', text_lower):
-                skills_analysis['certifications'].append(cert.title())
-        
-        # Flatten technical skills for easier access
-        all_technical = []
-        for category in skills_analysis['technical_skills'].values():
-            for subcategory in category.values():
-                all_technical.extend(subcategory)
-        
-        skills_analysis['programming_languages'] = self.get_skills_by_category(skills_analysis, 'programming_languages')
-        skills_analysis['frameworks_and_libraries'] = self.get_skills_by_category(skills_analysis, 'web_technologies')
-        skills_analysis['databases'] = self.get_skills_by_category(skills_analysis, 'databases')
-        skills_analysis['cloud_platforms'] = self.get_skills_by_category(skills_analysis, 'cloud_platforms')
-        skills_analysis['tools_and_technologies'] = self.get_skills_by_category(skills_analysis, 'devops_tools')
-        
+
+        # Confidence, context windows and experience come straight from the offsets
+        for formatted_skill, offsets in match_offsets.items():
+            # Fuzzy hits start from a higher base so a single approximate
+            # mention is not scored below a single exact one
+            base = 60 if formatted_skill in fuzzy_skills else 50
+            confidence = min(len(offsets) * 10 + base, 95)
+            skills_analysis['skill_confidence_scores'][formatted_skill] = confidence
+
+            contexts = []
+            for start, end in offsets[:3]:  # Limit to first 3 contexts
+                context = text[max(0, start - 50):min(len(text), end + 50)].strip()
+                contexts.append(context)
+            skills_analysis['skill_context'][formatted_skill] = contexts
+
+            years = self.extract_skill_experience(year_mentions, year_positions, offsets)
+            if years:
+                skills_analysis['years_of_experience'][formatted_skill] = years
+
+        # Soft skills and certifications share a second automaton pass
+        for end_index, (length, entries) in self.keyword_automaton.iter(scan_text):
+            start = end_index - length + 1
+            end = end_index + 1
+            if not self._is_word_boundary(scan_text, start, end):
+                continue
+            for result_key, formatted_name in entries:
+                if formatted_name not in skills_analysis[result_key]:
+                    skills_analysis[result_key].append(formatted_name)
+        
+        # Flat per-category views were built alongside the sweep; dedup keeps order
+        for result_key, category in (('programming_languages', 'programming_languages'),
+                                     ('frameworks_and_libraries', 'web_technologies'),
+                                     ('databases', 'databases'),
+                                     ('cloud_platforms', 'cloud_platforms'),
+                                     ('tools_and_technologies', 'devops_tools')):
+            skills_analysis[result_key] = list(dict.fromkeys(category_flat.get(category, [])))
+
+        # Aggregates the extractor already knows, so downstream consumers do
+        # not re-walk the nested technical_skills structure
+        skills_analysis['total_technical_skills'] = total_skills
+        skills_analysis['_nonempty_categories'] = len(category_flat)
+        category_mask = 0
+        for category in category_flat:
+            category_mask |= _CAT_BITS.get(category, 0)
+        skills_analysis['_category_mask'] = category_mask
+
         return skills_analysis
 
+    @staticmethod
+    def _skills_index(skills_analysis: Dict) -> SkillsIndex:
+        """Flattened skills view, built once and cached on the analysis dict.
+
+        The cache lives under a private key that analyze_resume never copies
+        into the returned result, so it stays internal to one analysis run.
+        """
+        index = skills_analysis.get('_index')
+        if index is None:
+            index = skills_analysis['_index'] = SkillsIndex.build(skills_analysis)
+        return index
+
     def get_skills_by_category(self, skills_analysis: Dict, category: str) -> List[str]:
         """Helper to get skills by category"""
-        skills = []
-        if category in skills_analysis['technical_skills']:
-            for subcategory in skills_analysis['technical_skills'][category].values():
-                skills.extend(subcategory)
-        return skills
-
-    def extract_skill_experience(self, text: str, skill: str) -> Optional[int]:
-        """Extract years of experience for a specific skill"""
-        # Patterns to find experience with specific skills
-        patterns = [
-            rf'{re.escape(skill)}.*?(\d+)\+?\s*years?',
-            rf'(\d+)\+?\s*years?.*?{re.escape(skill)}',
-            rf'{re.escape(skill)}.*?(\d+)\+?\s*yrs?',
-            rf'(\d+)\+?\s*yrs?.*?{re.escape(skill)}'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text.lower())
-            if matches:
-                try:
-                    return int(matches[0])
-                except (ValueError, IndexError):
-                    continue
-        
+        return list(self._skills_index(skills_analysis).by_category.get(category, ()))
+
+    @staticmethod
+    def extract_skill_experience(year_mentions: List[Tuple[int, int]],
+                                 year_positions: List[int],
+                                 offsets: List[Tuple[int, int]],
+                                 window: int = 80) -> Optional[int]:
+        """Find a years-of-experience mention near any match of a skill"""
+        for start, end in offsets:
+            index = bisect_left(year_positions, start - window)
+            if index < len(year_positions) and year_positions[index] <= end + window:
+                return year_mentions[index][1]
+
         return None
 
     def format_skill_name(self, skill: str) -> str:
         """Format skill names with proper capitalization"""
-        special_cases = {
-            'javascript': 'JavaScript',
-            'typescript': 'TypeScript',
-            'nodejs': 'Node.js',
-            'reactjs': 'React.js',
-            'vuejs': 'Vue.js',
-            'angularjs': 'Angular.js',
-            'mysql': 'MySQL',
-            'postgresql': 'PostgreSQL',
-            'mongodb': 'MongoDB',
-            'aws': 'AWS',
-            'gcp': 'Google Cloud Platform',
-            'html': 'HTML',
-            'css': 'CSS',
-            'sql': 'SQL',
-            'api': 'API',
-            'rest': 'REST',
-            'graphql': 'GraphQL',
-            'docker': 'Docker',
-            'kubernetes': 'Kubernetes',
-            'jenkins': 'Jenkins',
-            'git': 'Git',
-            'github': 'GitHub',
-            'gitlab': 'GitLab',
-            'jira': 'JIRA',
-            'ci/cd': 'CI/CD',
-            'devops': 'DevOps',
-            'mlops': 'MLOps',
-            'tensorflow': 'TensorFlow',
-            'pytorch': 'PyTorch',
-            'scikit-learn': 'Scikit-learn',
-            'pandas': 'Pandas',
-            'numpy': 'NumPy'
-        }
-        
-        return special_cases.get(skill.lower(), skill.title())
+        return _format_skill_name(skill)
 
-    def determine_experience_level(self, text: str, skills_analysis: Dict) -> Dict[str, Any]:
+    def determine_experience_level(self, text: str, skills_analysis: Dict,
+                                   text_lower: Optional[str] = None) -> Dict[str, Any]:
         """Comprehensive experience level determination"""
         experience_analysis = {
             'level': 'junior',
@@ -602,119 +1322,93 @@ class AdvancedResumeAnalyzer:
             'breadth_score': 0
         }
         
-        text_lower = text.lower()
-        
-        # Extract years of experience patterns
-        year_patterns = [
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|exp)',
-            r'(\d+)\+?\s*yrs?\s*(?:of\s*)?(?:experience|exp)',
-            r'experience.*?(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*years?\s*in\s*(?:software|development|programming)',
-            r'over\s*(\d+)\s*years?',
-            r'more\s*than\s*(\d+)\s*years?'
-        ]
-        
-        for pattern in year_patterns:
-            matches = re.findall(pattern, text_lower)
-            for match in matches:
-                try:
-                    years = int(match)
-                    experience_analysis['years_found'].append(years)
-                except ValueError:
-                    continue
-        
-        # Senior level indicators
-        senior_keywords = [
-            'senior', 'lead', 'principal', 'architect', 'manager', 'director',
-            'head of', 'vp', 'cto', 'chief', 'team lead', 'technical lead',
-            'staff engineer', 'distinguished engineer'
-        ]
-        
-        # Mid-level indicators
-        mid_keywords = [
-            'mid-level', 'intermediate', 'software engineer ii', 'engineer ii',
-            'associate', 'specialist'
-        ]
-        
-        # Leadership indicators
-        leadership_patterns = [
-            r'led\s+(?:a\s+)?team\s+of\s+(\d+)',
-            r'managed\s+(\d+)\s+(?:developers|engineers|people)',
-            r'mentored\s+(\d+)',
-            r'supervised\s+(\d+)',
-            r'coordinated\s+with\s+(\d+)'
-        ]
-        
-        for pattern in leadership_patterns:
-            matches = re.findall(pattern, text_lower)
-            for match in matches:
-                try:
-                    team_size = int(match)
-                    experience_analysis['leadership_indicators'].append(f"Led team of {team_size}")
-                except ValueError:
-                    continue
-        
-        # Technical depth analysis
-        total_skills = sum(len(category) for category_dict in skills_analysis['technical_skills'].values() 
-                          for category in category_dict.values())
+        text_lower = text_lower or text.lower()
+
+        # Extract years of experience in a single pass
+        for match in _YEAR_RE.finditer(text_lower):
+            years = int(match.group('years') or match.group('years_about'))
+            experience_analysis['years_found'].append(years)
+        
+        # Leadership indicators in a single pass
+        for match in _LEADERSHIP_RE.finditer(text_lower):
+            team_size = int(match.group(match.lastgroup))
+            experience_analysis['leadership_indicators'].append(f"Led team of {team_size}")
+        
+        # Technical depth analysis (aggregates computed during extraction)
+        total_skills = skills_analysis.get('total_technical_skills')
+        if total_skills is None:
+            total_skills = len(self._skills_index(skills_analysis).flat)
         experience_analysis['technical_depth'] = total_skills
-        
+
         # Breadth analysis (different technology categories)
-        categories_with_skills = sum(1 for category_dict in skills_analysis['technical_skills'].values() 
-                                   if any(category for category in category_dict.values()))
+        categories_with_skills = skills_analysis['_nonempty_categories']
         experience_analysis['breadth_score'] = categories_with_skills
         
         # Decision logic
         max_years = max(experience_analysis['years_found']) if experience_analysis['years_found'] else 0
         
-        # Calculate confidence and level
-        confidence_factors = []
-        
-        if max_years >= 8 or any(keyword in text_lower for keyword in senior_keywords):
+        # Calculate confidence and level (running clamped sum; the clamp at 95
+        # commutes with addition of non-negative factors)
+        confidence = 0
+
+        if max_years >= 8 or _SENIOR_RE.search(text_lower):
             experience_analysis['level'] = 'senior'
-            confidence_factors.append(70)
+            confidence = min(confidence + 70, 95)
             experience_analysis['indicators'].append(f"Years: {max_years}" if max_years else "Senior keywords found")
-            
-        elif max_years >= 3 or any(keyword in text_lower for keyword in mid_keywords):
+
+        elif max_years >= 3 or _MID_RE.search(text_lower):
             experience_analysis['level'] = 'mid'
-            confidence_factors.append(60)
+            confidence = min(confidence + 60, 95)
             experience_analysis['indicators'].append(f"Years: {max_years}" if max_years else "Mid-level keywords found")
-            
+
         else:
             experience_analysis['level'] = 'junior'
-            confidence_factors.append(50)
+            confidence = min(confidence + 50, 95)
             experience_analysis['indicators'].append("Limited experience indicators")
-        
+
         # Adjust based on technical depth
         if total_skills > 15:
-            confidence_factors.append(20)
+            confidence = min(confidence + 20, 95)
             experience_analysis['indicators'].append(f"High technical skill count: {total_skills}")
         elif total_skills > 8:
-            confidence_factors.append(10)
-        
+            confidence = min(confidence + 10, 95)
+
         # Adjust based on leadership
         if experience_analysis['leadership_indicators']:
-            confidence_factors.append(15)
+            confidence = min(confidence + 15, 95)
             experience_analysis['indicators'].extend(experience_analysis['leadership_indicators'])
-        
+
         # Adjust based on breadth
         if categories_with_skills >= 4:
-            confidence_factors.append(10)
+            confidence = min(confidence + 10, 95)
             experience_analysis['indicators'].append(f"Broad technical expertise: {categories_with_skills} categories")
-        
-        experience_analysis['confidence'] = min(sum(confidence_factors), 95)
+
+        experience_analysis['confidence'] = confidence
         
         return experience_analysis
 
     def generate_detailed_job_recommendations(self, skills_analysis: Dict, experience_analysis: Dict) -> List[Dict[str, Any]]:
         """Generate detailed job recommendations with market analysis"""
+        # Stable fingerprint of the inputs (private working keys excluded);
+        # a repeat analysis of the same profile is a dict hit
+        fingerprint = hashlib.blake2b(
+            _dumps_sorted({'s': {k: v for k, v in skills_analysis.items() if not k.startswith('_')},
+                           'e': experience_analysis}),
+            digest_size=16).digest()
+        cached = self._recommendation_cache.get(fingerprint)
+        if cached is not None:
+            self._recommendation_cache.move_to_end(fingerprint)
+            return cached
+
         recommendations = []
         experience_level = experience_analysis['level']
-        
+
         # Determine primary technology stack
         primary_stack = self.determine_primary_stack(skills_analysis)
         
-        # Generate role-specific recommendations
+        # Generate role-specific recommendations: the gates in _ROLE_SPECS
+        # decide from the cached index which renderers are worth calling, so
+        # a role the resume clearly does not fit costs one predicate
         role_generators = {
             'software_engineer': self.generate_software_engineer_roles,
             'data_scientist': self.generate_data_scientist_roles,
@@ -725,21 +1419,32 @@ class AdvancedResumeAnalyzer:
             'mobile_developer': self.generate_mobile_roles,
             'security_engineer': self.generate_security_roles
         }
+
+        index = self._skills_index(skills_analysis)
+        try:
+            for role_type, gate in _ROLE_SPECS:
+                if gate(skills_analysis, index):
+                    recommendations.extend(
+                        role_generators[role_type](skills_analysis, experience_level, primary_stack))
+        except Exception as e:
+            logger.warning("Failed to generate role recommendations: %s", e)
         
-        for role_type, generator in role_generators.items():
-            try:
-                role_recommendations = generator(skills_analysis, experience_level, primary_stack)
-                recommendations.extend(role_recommendations)
-            except Exception as e:
-                logger.warning(f"Failed to generate {role_type} recommendations: {e}")
-        
-        # Sort by match percentage and return top recommendations
-        recommendations.sort(key=lambda x: x['match_percentage'], reverse=True)
-        return recommendations[:8]
+        # Top-k selection beats sorting the whole list just to slice it
+        top_recommendations = heapq.nlargest(8, recommendations,
+                                             key=operator.itemgetter('match_percentage'))
+
+        self._recommendation_cache[fingerprint] = top_recommendations
+        if len(self._recommendation_cache) > self._recommendation_cache_size:
+            self._recommendation_cache.popitem(last=False)
+        return top_recommendations
 
     def determine_primary_stack(self, skills_analysis: Dict) -> str:
         """Determine the primary technology stack"""
-        # Count skills in different stacks
+        # Score each stack with a single compiled alternation scan over the
+        # flattened technical skills; counting distinct keywords keeps the
+        # old one-point-per-indicator scoring
+        flat_skills = self._skills_index(skills_analysis).tech_joined
+
         stack_scores = {
             'web_fullstack': 0,
             'data_science': 0,
@@ -747,53 +1452,35 @@ class AdvancedResumeAnalyzer:
             'devops': 0,
             'security': 0
         }
-        
-        # Web/Full-stack indicators
-        web_skills = ['javascript', 'react', 'angular', 'vue', 'node.js', 'html', 'css']
-        for skill in web_skills:
-            if any(skill.lower() in s.lower() for category in skills_analysis['technical_skills'].values() 
-                  for subcategory in category.values() for s in subcategory):
-                stack_scores['web_fullstack'] += 1
-        
-        # Data science indicators
-        ds_skills = ['python', 'pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'r']
-        for skill in ds_skills:
-            if any(skill.lower() in s.lower() for category in skills_analysis['technical_skills'].values() 
-                  for subcategory in category.values() for s in subcategory):
-                stack_scores['data_science'] += 1
-        
-        # Mobile indicators
-        mobile_skills = ['react native', 'flutter', 'swift', 'kotlin', 'ios', 'android']
-        for skill in mobile_skills:
-            if any(skill.lower() in s.lower() for category in skills_analysis['technical_skills'].values() 
-                  for subcategory in category.values() for s in subcategory):
-                stack_scores['mobile'] += 1
-        
-        # DevOps indicators
-        devops_skills = ['docker', 'kubernetes', 'jenkins', 'terraform', 'ansible', 'aws', 'azure']
-        for skill in devops_skills:
-            if any(skill.lower() in s.lower() for category in skills_analysis['technical_skills'].values() 
-                  for subcategory in category.values() for s in subcategory):
-                stack_scores['devops'] += 1
-        
+        try:
+            automaton = _stack_keyword_automaton()
+        except ImportError:
+            automaton = None
+
+        if automaton is not None:
+            seen_keywords = set()
+            for _, (keyword, stacks) in automaton.iter(flat_skills):
+                if keyword not in seen_keywords:
+                    seen_keywords.add(keyword)
+                    for stack in stacks:
+                        stack_scores[stack] += 1
+        else:
+            for name, pattern in _STACK_PATTERNS.items():
+                stack_scores[name] = len(set(pattern.findall(flat_skills)))
+
         return max(stack_scores, key=stack_scores.get)
 
     def generate_software_engineer_roles(self, skills_analysis: Dict, experience_level: str, primary_stack: str) -> List[Dict[str, Any]]:
         """Generate software engineer role recommendations"""
         roles = []
         
-        base_role = {
-            'category': 'Software Engineering',
-            'remote_friendly': True,
-            'growth_potential': 'High',
-            'market_demand': 'Very High'
-        }
+        base_role = _BASE_ROLE_SOFTWARE
         
         if experience_level == 'junior':
             roles.append({
                 **base_role,
                 'title': 'Junior Software Developer',
-                'match_percentage': self.calculate_match_percentage(skills_analysis, ['programming', 'version control']),
+                'match_percentage': self.calculate_match_percentage(skills_analysis, _REQ_SWE_JUNIOR),
                 'salary_range': '$60,000 - $90,000',
                 'company_types': ['Startups', 'Mid-size Companies', 'Agencies'],
                 'required_skills': ['Programming fundamentals', 'Version control (Git)', 'Problem solving'],
@@ -806,7 +1493,7 @@ class AdvancedResumeAnalyzer:
             roles.append({
                 **base_role,
                 'title': 'Software Engineer',
-                'match_percentage': self.calculate_match_percentage(skills_analysis, ['programming', 'system design', 'databases']),
+                'match_percentage': self.calculate_match_percentage(skills_analysis, _REQ_SWE_MID),
                 'salary_range': '$90,000 - $130,000',
                 'company_types': ['Tech Companies', 'Enterprise', 'Scale-ups'],
                 'required_skills': ['Multiple programming languages', 'System design', 'Database knowledge'],
@@ -819,7 +1506,7 @@ class AdvancedResumeAnalyzer:
             roles.append({
                 **base_role,
                 'title': 'Senior Software Engineer',
-                'match_percentage': self.calculate_match_percentage(skills_analysis, ['architecture', 'leadership', 'mentoring']),
+                'match_percentage': self.calculate_match_percentage(skills_analysis, _REQ_SWE_SENIOR),
                 'salary_range': '$130,000 - $180,000',
                 'company_types': ['Large Tech', 'Enterprise', 'High-growth Startups'],
                 'required_skills': ['Software architecture', 'Technical leadership', 'Mentoring'],
@@ -831,27 +1518,15 @@ class AdvancedResumeAnalyzer:
         return roles
 
     def generate_data_scientist_roles(self, skills_analysis: Dict, experience_level: str, primary_stack: str) -> List[Dict[str, Any]]:
-        """Generate data scientist role recommendations"""
-        # Check if candidate has data science skills
-        ds_skills = skills_analysis.get('programming_languages', []) + \
-                   self.get_skills_by_category(skills_analysis, 'data_science')
-        
-        if not any('python' in skill.lower() or 'r' in skill.lower() for skill in ds_skills):
-            return []
-        
+        """Generate data scientist role recommendations (gated by _ROLE_SPECS)"""
         roles = []
-        base_role = {
-            'category': 'Data Science',
-            'remote_friendly': True,
-            'growth_potential': 'Very High',
-            'market_demand': 'High'
-        }
+        base_role = _BASE_ROLE_DATA_SCIENCE
         
         if experience_level == 'junior':
             roles.append({
                 **base_role,
                 'title': 'Junior Data Scientist',
-                'match_percentage': self.calculate_match_percentage(skills_analysis, ['python', 'statistics', 'sql']),
+                'match_percentage': self.calculate_match_percentage(skills_analysis, _REQ_DATA_SCIENTIST),
                 'salary_range': '$70,000 - $100,000',
                 'company_types': ['Tech Companies', 'Consulting', 'Research'],
                 'required_skills': ['Python/R', 'Statistics', 'SQL', 'Data visualization'],
@@ -863,26 +1538,18 @@ class AdvancedResumeAnalyzer:
         return roles
 
     def generate_devops_roles(self, skills_analysis: Dict, experience_level: str, primary_stack: str) -> List[Dict[str, Any]]:
-        """Generate DevOps role recommendations"""
+        """Generate DevOps role recommendations (gated by _ROLE_SPECS)"""
         devops_skills = self.get_skills_by_category(skills_analysis, 'devops_tools') + \
                        self.get_skills_by_category(skills_analysis, 'cloud_platforms')
-        
-        if not devops_skills:
-            return []
-        
+
         roles = []
-        base_role = {
-            'category': 'DevOps/Infrastructure',
-            'remote_friendly': True,
-            'growth_potential': 'High',
-            'market_demand': 'Very High'
-        }
+        base_role = _BASE_ROLE_DEVOPS
         
         if experience_level == 'mid' or experience_level == 'senior':
             roles.append({
                 **base_role,
                 'title': f'{"Senior " if experience_level == "senior" else ""}DevOps Engineer',
-                'match_percentage': self.calculate_match_percentage(skills_analysis, ['docker', 'kubernetes', 'cloud']),
+                'match_percentage': self.calculate_match_percentage(skills_analysis, _REQ_DEVOPS),
                 'salary_range': '$95,000 - $135,000' if experience_level == 'mid' else '$135,000 - $185,000',
                 'company_types': ['Tech Companies', 'Enterprise', 'Cloud Providers'],
                 'required_skills': ['Containerization', 'CI/CD', 'Cloud platforms', 'Infrastructure as Code'],
@@ -894,28 +1561,17 @@ class AdvancedResumeAnalyzer:
         return roles
 
     def generate_frontend_roles(self, skills_analysis: Dict, experience_level: str, primary_stack: str) -> List[Dict[str, Any]]:
-        """Generate frontend developer role recommendations"""
-        frontend_skills = []
-        web_tech = skills_analysis['technical_skills'].get('web_technologies', {})
-        for category in web_tech.values():
-            frontend_skills.extend(category)
-        
-        if not any('react' in skill.lower() or 'angular' in skill.lower() or 'vue' in skill.lower() 
-                  for skill in frontend_skills):
-            return []
-        
+        """Generate frontend developer role recommendations (gated by _ROLE_SPECS)"""
+        index = self._skills_index(skills_analysis)
+        frontend_skills = list(index.by_category.get('web_technologies', ()))
+
         roles = []
-        base_role = {
-            'category': 'Frontend Development',
-            'remote_friendly': True,
-            'growth_potential': 'High',
-            'market_demand': 'High'
-        }
+        base_role = _BASE_ROLE_FRONTEND
         
         roles.append({
             **base_role,
             'title': f'{"Senior " if experience_level == "senior" else ""}Frontend Developer',
-            'match_percentage': self.calculate_match_percentage(skills_analysis, ['javascript', 'react', 'css']),
+            'match_percentage': self.calculate_match_percentage(skills_analysis, _REQ_FRONTEND),
             'salary_range': self.get_salary_range('frontend', experience_level),
             'company_types': ['Tech Companies', 'Agencies', 'E-commerce'],
             'required_skills': ['JavaScript', 'Modern frameworks', 'CSS/SCSS', 'Responsive design'],
@@ -927,24 +1583,16 @@ class AdvancedResumeAnalyzer:
         return roles
 
     def generate_backend_roles(self, skills_analysis: Dict, experience_level: str, primary_stack: str) -> List[Dict[str, Any]]:
-        """Generate backend developer role recommendations"""
+        """Generate backend developer role recommendations (gated by _ROLE_SPECS)"""
         backend_skills = skills_analysis['programming_languages'] + skills_analysis['databases']
-        
-        if not backend_skills:
-            return []
-        
+
         roles = []
-        base_role = {
-            'category': 'Backend Development',
-            'remote_friendly': True,
-            'growth_potential': 'High',
-            'market_demand': 'Very High'
-        }
+        base_role = _BASE_ROLE_BACKEND
         
         roles.append({
             **base_role,
             'title': f'{"Senior " if experience_level == "senior" else ""}Backend Developer',
-            'match_percentage': self.calculate_match_percentage(skills_analysis, ['programming', 'databases', 'api']),
+            'match_percentage': self.calculate_match_percentage(skills_analysis, _REQ_BACKEND),
             'salary_range': self.get_salary_range('backend', experience_level),
             'company_types': ['Tech Companies', 'Enterprise', 'Fintech'],
             'required_skills': ['Server-side programming', 'Database design', 'API development', 'System architecture'],
@@ -956,27 +1604,14 @@ class AdvancedResumeAnalyzer:
         return roles
 
     def generate_fullstack_roles(self, skills_analysis: Dict, experience_level: str, primary_stack: str) -> List[Dict[str, Any]]:
-        """Generate fullstack developer role recommendations"""
-        has_frontend = any('react' in skill.lower() or 'angular' in skill.lower() or 'vue' in skill.lower() 
-                          for category in skills_analysis['technical_skills'].get('web_technologies', {}).values()
-                          for skill in category)
-        has_backend = bool(skills_analysis['programming_languages'] and skills_analysis['databases'])
-        
-        if not (has_frontend and has_backend):
-            return []
-        
+        """Generate fullstack developer role recommendations (gated by _ROLE_SPECS)"""
         roles = []
-        base_role = {
-            'category': 'Full-Stack Development',
-            'remote_friendly': True,
-            'growth_potential': 'Very High',
-            'market_demand': 'Very High'
-        }
+        base_role = _BASE_ROLE_FULLSTACK
         
         roles.append({
             **base_role,
             'title': f'{"Senior " if experience_level == "senior" else ""}Full-Stack Developer',
-            'match_percentage': self.calculate_match_percentage(skills_analysis, ['frontend', 'backend', 'databases']),
+            'match_percentage': self.calculate_match_percentage(skills_analysis, _REQ_FULLSTACK),
             'salary_range': self.get_salary_range('fullstack', experience_level),
             'company_types': ['Startups', 'Tech Companies', 'Agencies'],
             'required_skills': ['Frontend frameworks', 'Backend development', 'Database design', 'Version control'],
@@ -989,31 +1624,20 @@ class AdvancedResumeAnalyzer:
         return roles
 
     def generate_mobile_roles(self, skills_analysis: Dict, experience_level: str, primary_stack: str) -> List[Dict[str, Any]]:
-        """Generate mobile developer role recommendations"""
+        """Generate mobile developer role recommendations (gated by _ROLE_SPECS)"""
         mobile_skills = self.get_skills_by_category(skills_analysis, 'web_technologies')
-        mobile_keywords = ['react native', 'flutter', 'swift', 'kotlin', 'ios', 'android']
-        
-        has_mobile = any(keyword in skill.lower() for skill in mobile_skills for keyword in mobile_keywords)
-        
-        if not has_mobile:
-            return []
-        
+
         roles = []
-        base_role = {
-            'category': 'Mobile Development',
-            'remote_friendly': True,
-            'growth_potential': 'High',
-            'market_demand': 'High'
-        }
+        base_role = _BASE_ROLE_MOBILE
         
         roles.append({
             **base_role,
             'title': f'{"Senior " if experience_level == "senior" else ""}Mobile Developer',
-            'match_percentage': self.calculate_match_percentage(skills_analysis, ['mobile', 'programming']),
+            'match_percentage': self.calculate_match_percentage(skills_analysis, _REQ_MOBILE),
             'salary_range': self.get_salary_range('mobile', experience_level),
             'company_types': ['Mobile-first Companies', 'Agencies', 'Enterprise'],
             'required_skills': ['Mobile frameworks', 'Platform-specific development', 'UI/UX principles'],
-            'preferred_skills': [skill for skill in mobile_skills if any(kw in skill.lower() for kw in mobile_keywords)][:4],
+            'preferred_skills': [skill for skill in mobile_skills if _MOBILE_RE.search(skill.lower())][:4],
             'job_description': 'Develop mobile applications for iOS and/or Android platforms.',
             'career_path': 'Mobile → Senior Mobile → Mobile Architect → Engineering Manager'
         })
@@ -1021,27 +1645,19 @@ class AdvancedResumeAnalyzer:
         return roles
 
     def generate_security_roles(self, skills_analysis: Dict, experience_level: str, primary_stack: str) -> List[Dict[str, Any]]:
-        """Generate security engineer role recommendations"""
+        """Generate security engineer role recommendations (gated by _ROLE_SPECS)"""
         security_skills = self.get_skills_by_category(skills_analysis, 'security')
-        security_certs = [cert for cert in skills_analysis['certifications'] 
-                         if any(sec_term in cert.lower() for sec_term in ['security', 'cissp', 'cism', 'cisa'])]
-        
-        if not (security_skills or security_certs):
-            return []
-        
+        security_certs = [cert for cert in skills_analysis['certifications']
+                         if any(sec_term in cert.lower() for sec_term in _SECURITY_TERMS)]
+
         roles = []
-        base_role = {
-            'category': 'Cybersecurity',
-            'remote_friendly': True,
-            'growth_potential': 'Very High',
-            'market_demand': 'Very High'
-        }
+        base_role = _BASE_ROLE_SECURITY
         
-        if experience_level in ['mid', 'senior']:
+        if experience_level in ('mid', 'senior'):
             roles.append({
                 **base_role,
                 'title': f'{"Senior " if experience_level == "senior" else ""}Security Engineer',
-                'match_percentage': self.calculate_match_percentage(skills_analysis, ['security', 'networking']),
+                'match_percentage': self.calculate_match_percentage(skills_analysis, _REQ_SECURITY),
                 'salary_range': self.get_salary_range('security', experience_level),
                 'company_types': ['Enterprise', 'Financial Services', 'Government'],
                 'required_skills': ['Security frameworks', 'Risk assessment', 'Incident response', 'Compliance'],
@@ -1052,69 +1668,77 @@ class AdvancedResumeAnalyzer:
         
         return roles
 
+    # Flat (role_type, experience_level) table: one hash lookup per call and
+    # no throwaway dict on unknown role types
+    _SALARY_RANGES = {
+        ('frontend', 'junior'): '$55,000 - $80,000',
+        ('frontend', 'mid'): '$80,000 - $115,000',
+        ('frontend', 'senior'): '$115,000 - $160,000',
+        ('backend', 'junior'): '$60,000 - $85,000',
+        ('backend', 'mid'): '$85,000 - $125,000',
+        ('backend', 'senior'): '$125,000 - $170,000',
+        ('fullstack', 'junior'): '$65,000 - $90,000',
+        ('fullstack', 'mid'): '$90,000 - $130,000',
+        ('fullstack', 'senior'): '$130,000 - $180,000',
+        ('mobile', 'junior'): '$60,000 - $85,000',
+        ('mobile', 'mid'): '$85,000 - $120,000',
+        ('mobile', 'senior'): '$120,000 - $165,000',
+        ('security', 'junior'): '$65,000 - $90,000',
+        ('security', 'mid'): '$90,000 - $130,000',
+        ('security', 'senior'): '$130,000 - $180,000'
+    }
+
     def get_salary_range(self, role_type: str, experience_level: str) -> str:
         """Get salary range based on role type and experience level"""
-        salary_ranges = {
-            'frontend': {
-                'junior': '$55,000 - $80,000',
-                'mid': '$80,000 - $115,000',
-                'senior': '$115,000 - $160,000'
-            },
-            'backend': {
-                'junior': '$60,000 - $85,000',
-                'mid': '$85,000 - $125,000',
-                'senior': '$125,000 - $170,000'
-            },
-            'fullstack': {
-                'junior': '$65,000 - $90,000',
-                'mid': '$90,000 - $130,000',
-                'senior': '$130,000 - $180,000'
-            },
-            'mobile': {
-                'junior': '$60,000 - $85,000',
-                'mid': '$85,000 - $120,000',
-                'senior': '$120,000 - $165,000'
-            },
-            'security': {
-                'junior': '$65,000 - $90,000',
-                'mid': '$90,000 - $130,000',
-                'senior': '$130,000 - $180,000'
-            }
-        }
-        
-        return salary_ranges.get(role_type, {}).get(experience_level, '$60,000 - $120,000')
+        return self._SALARY_RANGES.get((role_type, experience_level), '$60,000 - $120,000')
 
-    def calculate_match_percentage(self, skills_analysis: Dict, required_skills: List[str]) -> int:
+    def calculate_match_percentage(self, skills_analysis: Dict, required_skills: Tuple[str, ...]) -> int:
         """Calculate job match percentage based on skills"""
-        all_user_skills = []
-        
-        # Collect all user skills
-        for category in skills_analysis['technical_skills'].values():
-            for subcategory in category.values():
-                all_user_skills.extend([skill.lower() for skill in subcategory])
-        
-        all_user_skills.extend([skill.lower() for skill in skills_analysis['soft_skills']])
-        all_user_skills.extend([skill.lower() for skill in skills_analysis['certifications']])
-        
-        # Calculate matches
-        matches = 0
-        for required_skill in required_skills:
-            if any(required_skill.lower() in user_skill for user_skill in all_user_skills):
-                matches += 1
+        if not required_skills:
+            return 65
+
+        # The newline-joined buffer keeps substring semantics: a required
+        # skill can only match within a single user skill, never across two
+        user_skills = self._skills_index(skills_analysis).joined
+
+        try:
+            ahocorasick = _lazy_import('ahocorasick')
+        except ImportError:
+            ahocorasick = None
+
+        if ahocorasick is not None:
+            # All required skills are matched in one scan of the buffer
+            automaton = _required_skills_automaton(tuple(required_skills))
+            matches = len({original for _, original in automaton.iter(user_skills)})
+        else:
+            matches = 0
+            for required_skill in required_skills:
+                if required_skill.lower() in user_skills:
+                    matches += 1
         
-        # Base percentage + bonus for matches
+        # Base percentage + bonus for matches; integer arithmetic keeps the
+        # return type honest and the heap comparisons on the PyLong fast path
         base_percentage = 65
-        match_bonus = (matches / len(required_skills)) * 30 if required_skills else 0
-        
+        match_bonus = (matches * 30) // len(required_skills)
+
         return min(base_percentage + match_bonus, 95)
 
-    def generate_improvement_suggestions(self, text: str, skills_analysis: Dict, experience_analysis: Dict) -> List[Dict[str, Any]]:
-        """Generate comprehensive improvement suggestions"""
+    def generate_improvement_suggestions(self, text: str, skills_analysis: Dict, experience_analysis: Dict,
+                                         text_lower: Optional[str] = None,
+                                         has_quant: Optional[bool] = None,
+                                         has_portfolio: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """Generate comprehensive improvement suggestions.
+
+        has_quant/has_portfolio accept the predicate results when the caller
+        has already scanned the text, avoiding repeat regex passes.
+        """
         suggestions = []
-        
-        # Analyze resume structure and content
-        structure_analysis = self.analyze_resume_structure(text)
-        
+
+        if has_quant is None:
+            has_quant = self.has_quantifiable_achievements(text)
+        if has_portfolio is None:
+            has_portfolio = self.has_portfolio_links(text)
+
         # Skills gap analysis
         if len(skills_analysis['programming_languages']) < 2:
             suggestions.append({
@@ -1138,7 +1762,7 @@ class AdvancedResumeAnalyzer:
             })
         
         # Quantifiable achievements
-        if not self.has_quantifiable_achievements(text):
+        if not has_quant:
             suggestions.append({
                 'category': 'Content Quality',
                 'priority': 'High',
@@ -1149,7 +1773,7 @@ class AdvancedResumeAnalyzer:
             })
         
         # Leadership experience
-        if experience_analysis['level'] in ['mid', 'senior'] and not experience_analysis['leadership_indicators']:
+        if experience_analysis['level'] in ('mid', 'senior') and not experience_analysis['leadership_indicators']:
             suggestions.append({
                 'category': 'Experience',
                 'priority': 'Medium',
@@ -1160,7 +1784,7 @@ class AdvancedResumeAnalyzer:
             })
         
         # Portfolio and projects
-        if not self.has_portfolio_links(text):
+        if not has_portfolio:
             suggestions.append({
                 'category': 'Portfolio',
                 'priority': 'Medium',
@@ -1204,7 +1828,7 @@ class AdvancedResumeAnalyzer:
         
         return suggestions[:6]  # Return top 6 suggestions
 
-    def analyze_resume_structure(self, text: str) -> Dict[str, Any]:
+    def analyze_resume_structure(self, text: str, text_lower: Optional[str] = None) -> Dict[str, Any]:
         """Analyze the structure and organization of the resume"""
         structure = {
             'has_contact_info': False,
@@ -1216,28 +1840,21 @@ class AdvancedResumeAnalyzer:
             'estimated_length': 'unknown'
         }
         
-        text_lower = text.lower()
-        
-        # Check for standard resume sections
-        if re.search(r'(email|phone|linkedin|github)', text_lower):
-            structure['has_contact_info'] = True
-            structure['section_count'] += 1
-        
-        if re.search(r'(summary|objective|profile|about)', text_lower):
-            structure['has_summary'] = True
-            structure['section_count'] += 1
-        
-        if re.search(r'(experience|employment|work history)', text_lower):
-            structure['has_experience'] = True
-            structure['section_count'] += 1
-        
-        if re.search(r'(education|degree|university|college)', text_lower):
-            structure['has_education'] = True
-            structure['section_count'] += 1
-        
-        if re.search(r'(skills|technologies|competencies)', text_lower):
-            structure['has_skills_section'] = True
-            structure['section_count'] += 1
+        text_lower = text_lower or text.lower()
+
+        # One tagged scan covers all five section checks; stop early once
+        # every section has been seen
+        flags = dict.fromkeys(_STRUCTURE_FLAGS, False)
+        for match in _STRUCTURE_RE.finditer(text_lower):
+            if not flags[match.lastgroup]:
+                flags[match.lastgroup] = True
+                if all(flags.values()):
+                    break
+
+        for flag_name, found in flags.items():
+            if found:
+                structure[flag_name] = True
+                structure['section_count'] += 1
         
         # Estimate resume length
         word_count = len(text.split())
@@ -1252,346 +1869,243 @@ class AdvancedResumeAnalyzer:
 
     def has_quantifiable_achievements(self, text: str) -> bool:
         """Check if resume contains quantifiable achievements"""
-        achievement_patterns = [
-            r'\d+%',  # Percentages
-            r'increased.*?\d+',
-            r'improved.*?\d+',
-            r'reduced.*?\d+',
-            r'saved.*?\$\d+',
-            r'generated.*?\$\d+',
-            r'managed.*?\$\d+',
-            r'led.*?team.*?\d+',
-            r'supervised.*?\d+'
-        ]
-        
-        for pattern in achievement_patterns:
-            if re.search(pattern, text.lower()):
-                return True
-        
-        return False
+        return _ACHIEVEMENT_RE.search(text) is not None
 
     def has_portfolio_links(self, text: str) -> bool:
         """Check if resume contains portfolio or project links"""
-        link_patterns = [
-            r'github\.com',
-            r'gitlab\.com',
-            r'portfolio',
-            r'project.*?link',
-            r'demo.*?link',
-            r'live.*?site'
-        ]
-        
-        for pattern in link_patterns:
-            if re.search(pattern, text.lower()):
-                return True
-        
-        return False
+        return _LINK_RE.search(text) is not None
 
-    def generate_interview_questions(self, skills_analysis: Dict, experience_analysis: Dict) -> List[Dict[str, Any]]:
-        """Generate comprehensive interview questions based on profile"""
-        questions = []
+    def _iter_interview_questions(self, skills_analysis: Dict, experience_analysis: Dict):
+        """Yield candidate interview questions in priority order.
+
+        Lazy so that generate_interview_questions stops the moment its cap
+        is reached; entries past the cut are never materialized.
+        """
         experience_level = experience_analysis['level']
-        
-        # Technical questions based on skills
-        primary_skills = skills_analysis['programming_languages'][:2]
-        for skill in primary_skills:
-            questions.append({
+
+        # Technical questions based on skills (the only per-resume templates)
+        for skill in skills_analysis['programming_languages'][:2]:
+            yield {
                 'question': f"Explain your experience with {skill} and describe a challenging project where you used it effectively.",
                 'category': 'Technical',
                 'difficulty': 'Medium',
                 'skill_focus': skill,
                 'follow_up': f"What are some best practices you follow when working with {skill}?"
-            })
-        
+            }
+
         # System design questions (for mid/senior levels)
-        if experience_level in ['mid', 'senior']:
-            questions.extend([
-                {
-                    'question': 'Design a scalable system for a social media platform that handles millions of users.',
-                    'category': 'System Design',
-                    'difficulty': 'Hard',
-                    'skill_focus': 'Architecture',
-                    'follow_up': 'How would you handle data consistency and caching?'
-                },
-                {
-                    'question': 'How would you approach optimizing a slow-performing database query?',
-                    'category': 'Technical',
-                    'difficulty': 'Medium',
-                    'skill_focus': 'Database Optimization',
-                    'follow_up': 'What tools would you use to identify performance bottlenecks?'
-                }
-            ])
-        
+        if experience_level in ('mid', 'senior'):
+            yield from _SYSTEM_DESIGN_QUESTIONS
+
         # Behavioral questions
-        questions.extend([
-            {
-                'question': 'Tell me about a time when you had to learn a new technology quickly for a project.',
-                'category': 'Behavioral',
-                'difficulty': 'Medium',
-                'skill_focus': 'Adaptability',
-                'follow_up': 'How do you typically approach learning new technologies?'
-            },
-            {
-                'question': 'Describe a challenging bug you encountered and how you debugged it.',
-                'category': 'Behavioral',
-                'difficulty': 'Medium',
-                'skill_focus': 'Problem Solving',
-                'follow_up': 'What debugging strategies do you find most effective?'
-            },
-            {
-                'question': 'How do you handle disagreements with team members about technical decisions?',
-                'category': 'Behavioral',
-                'difficulty': 'Medium',
-                'skill_focus': 'Communication',
-                'follow_up': 'Can you give an example of when you changed your mind based on feedback?'
-            }
-        ])
-        
+        yield from _BEHAVIORAL_QUESTIONS
+
         # Leadership questions (for senior levels)
         if experience_level == 'senior':
-            questions.extend([
-                {
-                    'question': 'How do you mentor junior developers and help them grow?',
-                    'category': 'Leadership',
-                    'difficulty': 'Medium',
-                    'skill_focus': 'Mentoring',
-                    'follow_up': 'What\'s the most rewarding mentoring experience you\'ve had?'
-                },
-                {
-                    'question': 'Describe how you would handle a situation where your team is behind schedule on a critical project.',
-                    'category': 'Leadership',
-                    'difficulty': 'Hard',
-                    'skill_focus': 'Project Management',
-                    'follow_up': 'How do you balance quality with delivery  'Project Management',
-                    'follow_up': 'How do you balance quality with delivery deadlines?'
-                }
-            ])
-        
+            yield from _LEADERSHIP_QUESTIONS
+
         # Situational questions
-        questions.extend([
-            {
-                'question': 'How would you approach debugging a production issue that\'s affecting users?',
-                'category': 'Situational',
-                'difficulty': 'Medium',
-                'skill_focus': 'Incident Response',
-                'follow_up': 'What steps would you take to prevent similar issues in the future?'
-            },
-            {
-                'question': 'If you had to choose between delivering a feature on time with technical debt or delaying for a cleaner implementation, what would you do?',
-                'category': 'Situational',
-                'difficulty': 'Hard',
-                'skill_focus': 'Decision Making',
-                'follow_up': 'How do you communicate technical trade-offs to non-technical stakeholders?'
-            }
-        ])
-        
-        # Industry-specific questions based on skills
-        if self.get_skills_by_category(skills_analysis, 'data_science'):
-            questions.append({
-                'question': 'Explain the difference between supervised and unsupervised learning with examples.',
-                'category': 'Technical',
-                'difficulty': 'Medium',
-                'skill_focus': 'Machine Learning',
-                'follow_up': 'When would you choose one approach over the other?'
-            })
-        
-        if self.get_skills_by_category(skills_analysis, 'cloud_platforms'):
-            questions.append({
-                'question': 'How would you design a cloud architecture for high availability and disaster recovery?',
-                'category': 'Technical',
-                'difficulty': 'Hard',
-                'skill_focus': 'Cloud Architecture',
-                'follow_up': 'What are the cost implications of your design choices?'
-            })
-        
-        return questions[:10]  # Return top 10 questions
-
-    def calculate_overall_score(self, skills_analysis: Dict, experience_analysis: Dict, text: str, extraction_metadata: Dict) -> Dict[str, Any]:
-        """Calculate comprehensive resume score with detailed breakdown"""
-        score_breakdown = {
-            'technical_skills': 0,
-            'experience_quality': 0,
-            'content_structure': 0,
-            'achievements': 0,
-            'completeness': 0,
-            'extraction_quality': 0,
-            'total_score': 0,
-            'grade': 'F',
-            'strengths': [],
-            'areas_for_improvement': []
-        }
-        
-        # Technical Skills Score (30 points)
-        total_technical_skills = sum(len(category) for category_dict in skills_analysis['technical_skills'].values() 
-                                   for category in category_dict.values())
-        
-        if total_technical_skills >= 15:
-            score_breakdown['technical_skills'] = 30
-            score_breakdown['strengths'].append('Excellent technical skill diversity')
-        elif total_technical_skills >= 10:
-            score_breakdown['technical_skills'] = 25
-            score_breakdown['strengths'].append('Good technical skill range')
-        elif total_technical_skills >= 5:
-            score_breakdown['technical_skills'] = 20
-        else:
-            score_breakdown['technical_skills'] = 10
-            score_breakdown['areas_for_improvement'].append('Limited technical skills listed')
-        
-        # Experience Quality Score (25 points)
-        experience_score = 15  # Base score
-        
-        if experience_analysis['level'] == 'senior':
-            experience_score += 10
-        elif experience_analysis['level'] == 'mid':
-            experience_score += 5
-        
-        if experience_analysis['leadership_indicators']:
-            experience_score += 5
-            score_breakdown['strengths'].append('Leadership experience demonstrated')
-        
-        if experience_analysis['confidence'] > 80:
-            experience_score += 5
-        
-        score_breakdown['experience_quality'] = min(experience_score, 25)
-        
-        # Content Structure Score (20 points)
-        structure = self.analyze_resume_structure(text)
-        structure_score = structure['section_count'] * 3
-        
-        if structure['estimated_length'] == 'appropriate':
-            structure_score += 5
-        elif structure['estimated_length'] == 'too_long':
-            score_breakdown['areas_for_improvement'].append('Resume may be too lengthy')
-        elif structure['estimated_length'] == 'too_short':
-            score_breakdown['areas_for_improvement'].append('Resume lacks sufficient detail')
-        
-        score_breakdown['content_structure'] = min(structure_score, 20)
-        
-        # Achievements Score (15 points)
-        if self.has_quantifiable_achievements(text):
-            score_breakdown['achievements'] = 15
-            score_breakdown['strengths'].append('Quantifiable achievements included')
-        else:
-            score_breakdown['achievements'] = 5
-            score_breakdown['areas_for_improvement'].append('Add quantifiable achievements')
-        
-        # Completeness Score (10 points)
-        completeness_score = 0
-        
-        if skills_analysis['certifications']:
-            completeness_score += 3
-            score_breakdown['strengths'].append('Professional certifications listed')
-        
-        if self.has_portfolio_links(text):
-            completeness_score += 4
-            score_breakdown['strengths'].append('Portfolio/project links included')
-        
-        if len(skills_analysis['soft_skills']) >= 3:
-            completeness_score += 3
-        else:
-            score_breakdown['areas_for_improvement'].append('Include more soft skills')
-        
-        score_breakdown['completeness'] = completeness_score
-        
+        yield from _SITUATIONAL_QUESTIONS
+
+        # Industry-specific questions via the category bitmask from extraction
+        category_mask = skills_analysis.get('_category_mask')
+        if category_mask is None:
+            category_mask = (
+                (_CAT_BITS['data_science'] if self.get_skills_by_category(skills_analysis, 'data_science') else 0) |
+                (_CAT_BITS['cloud_platforms'] if self.get_skills_by_category(skills_analysis, 'cloud_platforms') else 0))
+
+        if category_mask & _CAT_BITS['data_science']:
+            yield _DATA_SCIENCE_QUESTION
+
+        if category_mask & _CAT_BITS['cloud_platforms']:
+            yield _CLOUD_QUESTION
+
+    def generate_interview_questions(self, skills_analysis: Dict, experience_analysis: Dict) -> List[Dict[str, Any]]:
+        """Generate comprehensive interview questions based on profile"""
+        # Return top 10 questions
+        return list(islice(self._iter_interview_questions(skills_analysis, experience_analysis), 10))
+
+    def calculate_overall_score(self, skills_analysis: Dict, experience_analysis: Dict, text: str,
+                                extraction_metadata: Dict, text_lower: Optional[str] = None,
+                                structure: Optional[Dict] = None,
+                                has_quant: Optional[bool] = None,
+                                has_portfolio: Optional[bool] = None) -> Dict[str, Any]:
+        """Calculate comprehensive resume score with detailed breakdown.
+
+        structure/has_quant/has_portfolio accept precomputed scan results so
+        analyze_resume can walk the cleaned text once for all consumers.
+        """
+        total_technical_skills = skills_analysis.get('total_technical_skills')
+        if total_technical_skills is None:
+            total_technical_skills = len(self._skills_index(skills_analysis).flat)
+
+        # Map the dict-shaped inputs down to primitives for the kernel
+        if structure is None:
+            structure = self.analyze_resume_structure(text, text_lower)
+        length_code = _LENGTH_CODES.get(structure['estimated_length'], -1)
+        has_leadership = bool(experience_analysis['leadership_indicators'])
+        if has_quant is None:
+            has_quant = self.has_quantifiable_achievements(text)
+        has_certs = bool(skills_analysis['certifications'])
+        if has_portfolio is None:
+            has_portfolio = self.has_portfolio_links(text)
+        num_soft_skills = len(skills_analysis['soft_skills'])
+
+        (technical, experience_score, structure_score, achievements, completeness,
+         total, strengths_mask, improvements_mask) = _score_components(
+            total_technical_skills,
+            _LEVEL_CODES.get(experience_analysis['level'], 0),
+            has_leadership,
+            experience_analysis['confidence'],
+            structure['section_count'],
+            length_code,
+            has_quant, has_certs, has_portfolio, num_soft_skills)
+
         # Extraction Quality Bonus/Penalty (5 points)
-        if extraction_metadata['extraction_quality'] == 'excellent':
-            score_breakdown['extraction_quality'] = 5
-        elif extraction_metadata['extraction_quality'] == 'good':
-            score_breakdown['extraction_quality'] = 3
-        elif extraction_metadata['extraction_quality'] == 'basic':
-            score_breakdown['extraction_quality'] = 1
-        else:
-            score_breakdown['extraction_quality'] = 0
-            score_breakdown['areas_for_improvement'].append('PDF format may need optimization')
-        
-        # Calculate total score
-        total = (score_breakdown['technical_skills'] + 
-                score_breakdown['experience_quality'] + 
-                score_breakdown['content_structure'] + 
-                score_breakdown['achievements'] + 
-                score_breakdown['completeness'])
-        
-        score_breakdown['total_score'] = min(total, 100)
-        
-        # Assign grade
-        if score_breakdown['total_score'] >= 90:
-            score_breakdown['grade'] = 'A+'
-        elif score_breakdown['total_score'] >= 85:
-            score_breakdown['grade'] = 'A'
-        elif score_breakdown['total_score'] >= 80:
-            score_breakdown['grade'] = 'A-'
-        elif score_breakdown['total_score'] >= 75:
-            score_breakdown['grade'] = 'B+'
-        elif score_breakdown['total_score'] >= 70:
-            score_breakdown['grade'] = 'B'
-        elif score_breakdown['total_score'] >= 65:
-            score_breakdown['grade'] = 'B-'
-        elif score_breakdown['total_score'] >= 60:
-            score_breakdown['grade'] = 'C+'
-        elif score_breakdown['total_score'] >= 55:
-            score_breakdown['grade'] = 'C'
-        else:
-            score_breakdown['grade'] = 'C-'
-        
-        return score_breakdown
+        extraction_quality = _EXTRACTION_POINTS.get(extraction_metadata['extraction_quality'], 0)
+        if not extraction_quality:
+            improvements_mask |= _I_PDF_FORMAT
+
+        # Materialize the note masks in table order
+        strengths = [note for i, note in enumerate(_STRENGTH_NOTES)
+                     if strengths_mask & (1 << i)]
+        areas_for_improvement = [note for i, note in enumerate(_IMPROVEMENT_NOTES)
+                                 if improvements_mask & (1 << i)]
+
+        return {
+            'technical_skills': technical,
+            'experience_quality': experience_score,
+            'content_structure': structure_score,
+            'achievements': achievements,
+            'completeness': completeness,
+            'extraction_quality': extraction_quality,
+            'total_score': total,
+            # Assign grade via threshold table instead of a nine-branch ladder
+            'grade': _GRADE_LABELS[bisect_right(_GRADE_THRESHOLDS, total)],
+            'strengths': strengths,
+            'areas_for_improvement': areas_for_improvement
+        }
+
+    def analyze_resume(self, pdf_bytes: Optional[bytes] = None, filename: str = "",
+                       include_raw_text: bool = False,
+                       text_override: Optional[str] = None,
+                       want_jobs: bool = True, want_suggestions: bool = True,
+                       want_questions: bool = True, want_score: bool = True) -> Dict[str, Any]:
+        """Main comprehensive analysis function.
+
+        The full extracted/cleaned text is omitted from the result unless
+        include_raw_text is set; by default callers get the length plus a
+        content hash, which keeps serialized payloads small. text_override
+        supplies already-extracted plaintext and skips PDF parsing entirely.
+        The want_* flags skip individual result sections (and their compute);
+        a skipped section's key is absent from the result.
+        """
+        # Monotonic clock for the duration; wall clock only for the timestamp
+        start_ns = time.perf_counter_ns()
+        analysis_timestamp = datetime.now().isoformat()
 
-    def analyze_resume(self, pdf_bytes: bytes, filename: str = "") -> Dict[str, Any]:
-        """Main comprehensive analysis function"""
-        analysis_start_time = datetime.now()
-        
         try:
-            logger.info(f"Starting comprehensive analysis of {filename}")
-            
-            # Extract text from PDF
-            extracted_text, extraction_metadata = self.extract_text_from_pdf(pdf_bytes)
+            logger.info("Starting comprehensive analysis of %s", filename)
+
+            # Extract text from PDF, unless the caller already has plaintext
+            if text_override is not None:
+                extracted_text = text_override
+                extraction_metadata = {
+                    'methods_tried': ['plain_text'],
+                    'successful_method': 'plain_text',
+                    'page_count': 1,
+                    'extraction_quality': 'excellent',
+                    'errors': []
+                }
+            else:
+                extracted_text, extraction_metadata = self.extract_text_from_pdf(pdf_bytes)
             
             if len(extracted_text.strip()) < 50:
                 raise ValueError("Could not extract meaningful text from PDF")
             
-            logger.info(f"Text extraction completed: {len(extracted_text)} characters using {extraction_metadata['successful_method']}")
+            logger.info("Text extraction completed: %d characters using %s", len(extracted_text), extraction_metadata['successful_method'])
             
             # Preprocess text
             preprocessing_result = self.preprocess_text(extracted_text)
             cleaned_text = preprocessing_result['cleaned_text']
             preprocessing_info = preprocessing_result['preprocessing_info']
             
-            logger.info(f"Text preprocessing completed: {preprocessing_info['cleaned_length']} characters after cleaning")
-            
+            logger.info("Text preprocessing completed: %d characters after cleaning", preprocessing_info['cleaned_length'])
+
+            # Lowercase once; every downstream scan shares this buffer
+            cleaned_lower = cleaned_text.lower()
+
             # Extract comprehensive skills
-            skills_analysis = self.extract_comprehensive_skills(cleaned_text)
-            total_skills = sum(len(category) for category_dict in skills_analysis['technical_skills'].values() 
-                             for category in category_dict.values())
-            logger.info(f"Skills extraction completed: {total_skills} technical skills found")
+            skills_analysis = self.extract_comprehensive_skills(cleaned_text, cleaned_lower)
+            total_skills = skills_analysis['total_technical_skills']
+            logger.info("Skills extraction completed: %d technical skills found", total_skills)
             
             # Determine experience level
-            experience_analysis = self.determine_experience_level(cleaned_text, skills_analysis)
-            logger.info(f"Experience analysis completed: {experience_analysis['level']} level with {experience_analysis['confidence']}% confidence")
-            
-            # Generate job recommendations
-            job_recommendations = self.generate_detailed_job_recommendations(skills_analysis, experience_analysis)
-            logger.info(f"Generated {len(job_recommendations)} job recommendations")
-            
-            # Generate improvement suggestions
-            improvement_suggestions = self.generate_improvement_suggestions(cleaned_text, skills_analysis, experience_analysis)
-            logger.info(f"Generated {len(improvement_suggestions)} improvement suggestions")
-            
-            # Generate interview questions
-            interview_questions = self.generate_interview_questions(skills_analysis, experience_analysis)
-            logger.info(f"Generated {len(interview_questions)} interview questions")
+            experience_analysis = self.determine_experience_level(cleaned_text, skills_analysis, cleaned_lower)
+            logger.info("Experience analysis completed: %s level with %d%% confidence", experience_analysis['level'], experience_analysis['confidence'])
             
-            # Calculate comprehensive score
-            score_analysis = self.calculate_overall_score(skills_analysis, experience_analysis, cleaned_text, extraction_metadata)
-            logger.info(f"Score calculation completed: {score_analysis['total_score']}/100 (Grade: {score_analysis['grade']})")
+            # The four remaining analyses only read shared inputs, and their
+            # regex-heavy scans release the GIL, so they can overlap. The
+            # skills index is built up front so the threads share one instance.
+            self._skills_index(skills_analysis)
+
+            # Scan the cleaned text once for the predicates both the score
+            # and the suggestions consume
+            if want_score or want_suggestions:
+                has_quant = self.has_quantifiable_achievements(cleaned_text)
+                has_portfolio = self.has_portfolio_links(cleaned_text)
+            else:
+                has_quant = has_portfolio = None
+            structure = self.analyze_resume_structure(cleaned_text, cleaned_lower) if want_score else None
+
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                future_jobs = executor.submit(self.generate_detailed_job_recommendations,
+                                              skills_analysis, experience_analysis) if want_jobs else None
+                future_suggestions = executor.submit(self.generate_improvement_suggestions,
+                                                     cleaned_text, skills_analysis,
+                                                     experience_analysis, cleaned_lower,
+                                                     has_quant, has_portfolio) if want_suggestions else None
+                future_questions = executor.submit(self.generate_interview_questions,
+                                                   skills_analysis, experience_analysis) if want_questions else None
+                future_score = executor.submit(self.calculate_overall_score,
+                                               skills_analysis, experience_analysis, cleaned_text,
+                                               extraction_metadata, cleaned_lower,
+                                               structure, has_quant, has_portfolio) if want_score else None
+
+                job_recommendations = future_jobs.result() if future_jobs else None
+                improvement_suggestions = future_suggestions.result() if future_suggestions else None
+                interview_questions = future_questions.result() if future_questions else None
+                score_analysis = future_score.result() if future_score else None
+
+            if want_jobs:
+                logger.info("Generated %d job recommendations", len(job_recommendations))
+            if want_suggestions:
+                logger.info("Generated %d improvement suggestions", len(improvement_suggestions))
+            if want_questions:
+                logger.info("Generated %d interview questions", len(interview_questions))
+            if want_score:
+                logger.info("Score calculation completed: %d/100 (Grade: %s)", score_analysis['total_score'], score_analysis['grade'])
             
             # Calculate analysis time
-            analysis_time = (datetime.now() - analysis_start_time).total_seconds()
-            
+            analysis_time = (time.perf_counter_ns() - start_ns) / 1e9
+
+            # Ship the raw text only on request; the hash still lets callers
+            # detect content changes without carrying the full payload
+            extracted_data = {
+                'text_length': len(extracted_text),
+                'text_sha256': hashlib.sha256(extracted_text.encode('utf-8')).hexdigest(),
+                'filename': filename
+            }
+            if include_raw_text:
+                extracted_data['full_text'] = extracted_text
+                extracted_data['cleaned_text'] = cleaned_text
+
             # Compile comprehensive result
             result = {
                 'analysis_metadata': {
                     'filename': filename,
                     'analysis_time_seconds': analysis_time,
-                    'analysis_timestamp': analysis_start_time.isoformat(),
+                    'analysis_timestamp': analysis_timestamp,
                     'analyzer_version': '2.0.0',
                     'extraction_method': extraction_metadata['successful_method'],
                     'extraction_quality': extraction_metadata['extraction_quality']
@@ -1615,30 +2129,57 @@ class AdvancedResumeAnalyzer:
                     'tools_and_technologies': skills_analysis['tools_and_technologies'],
                     'skill_confidence_scores': skills_analysis['skill_confidence_scores'],
                     'years_of_experience': skills_analysis['years_of_experience'],
-                    'total_technical_skills': sum(len(category) for category_dict in skills_analysis['technical_skills'].values() 
-                                                for category in category_dict.values())
+                    'total_technical_skills': total_skills
                 },
                 'experience_analysis': experience_analysis,
-                'score_analysis': score_analysis,
-                'job_recommendations': job_recommendations,
-                'improvement_suggestions': improvement_suggestions,
-                'interview_questions': interview_questions,
-                'extracted_data': {
-                    'full_text': extracted_text,
-                    'cleaned_text': cleaned_text,
-                    'text_length': len(extracted_text),
-                    'filename': filename
-                },
-                'analysis_method': 'python_advanced_comprehensive'
             }
+            if want_score:
+                result['score_analysis'] = score_analysis
+            if want_jobs:
+                result['job_recommendations'] = job_recommendations
+            if want_suggestions:
+                result['improvement_suggestions'] = improvement_suggestions
+            if want_questions:
+                result['interview_questions'] = interview_questions
+            result['extracted_data'] = extracted_data
+            result['analysis_method'] = 'python_advanced_comprehensive'
             
-            logger.info(f"Comprehensive analysis completed successfully in {analysis_time:.2f} seconds")
+            logger.info("Comprehensive analysis completed successfully in %.2f seconds", analysis_time)
             return result
             
-        except Exception as e:
-            logger.error(f"Analysis failed: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            raise e
+        except Exception:
+            logger.exception("Analysis failed")
+            raise
+
+    def analyze_batch(self, items: List[Tuple[bytes, str]],
+                      processes: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Analyze a batch of resumes across a process pool.
+
+        items is a list of (pdf_bytes, filename) pairs; results come back in
+        the same order. Each worker builds one analyzer in its initializer so
+        the skill automatons and NLP state load once per process, not once
+        per resume. Small batches stay in-process to skip the fork overhead.
+        """
+        if len(items) <= 1 or (processes is not None and processes <= 1):
+            return [self.analyze_resume(pdf_bytes, filename) for pdf_bytes, filename in items]
+
+        with Pool(processes or cpu_count(), initializer=_batch_worker_init) as pool:
+            return pool.starmap(_batch_worker, items)
+
+
+# Per-process analyzer for analyze_batch; module-level so Pool can pickle
+# the worker and each process pays the vocabulary setup cost exactly once
+_BATCH_ANALYZER = None
+
+
+def _batch_worker_init():
+    global _BATCH_ANALYZER
+    _BATCH_ANALYZER = AdvancedResumeAnalyzer()
+
+
+def _batch_worker(pdf_bytes: bytes, filename: str) -> Dict[str, Any]:
+    return _BATCH_ANALYZER.analyze_resume(pdf_bytes, filename)
+
 
 # Test and demonstration
 if __name__ == "__main__":
@@ -1700,11 +2241,8 @@ if __name__ == "__main__":
     • Machine Learning Pipeline: Created data processing pipeline using Python
     """
     
-    # Simulate PDF bytes
-    pdf_bytes = sample_text.encode('utf-8')
-    
     try:
-        result = analyzer.analyze_resume(pdf_bytes, "john_doe_resume.pdf")
+        result = analyzer.analyze_resume(filename="john_doe_resume.pdf", text_override=sample_text)
         
         print("\n" + "="*80)
         print("COMPREHENSIVE RESUME ANALYSIS RESULTS")
@@ -1,8 +1,14 @@
+import copy
+import heapq
 import os
+from bisect import bisect_right
 import json
 import re
 import sys
 import traceback
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 import requests
 from io import BytesIO
@@ -15,55 +21,207 @@ import time
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# PDF processing libraries
+# Hard dependencies; install them at build time (see bootstrap), never
+# by shelling out to pip while serving requests
 try:
     import PyPDF2
     import pdfplumber
     import fitz  # PyMuPDF
-except ImportError:
-    logger.info("Installing PDF processing libraries...")
-    os.system("pip install PyPDF2 pdfplumber PyMuPDF")
-    import PyPDF2
-    import pdfplumber
-    import fitz
+except ImportError as e:
+    raise ImportError("PDF libraries required: pip install PyPDF2 pdfplumber PyMuPDF") from e
+
+try:
+    import ahocorasick
+except ImportError as e:
+    raise ImportError("pyahocorasick required: pip install pyahocorasick") from e
 
-# Text processing libraries
 try:
     import nltk
-    from nltk.tokenize import word_tokenize, sent_tokenize
-    from nltk.corpus import stopwords
-    from nltk.stem import WordNetLemmatizer
-except ImportError:
-    logger.info("Installing NLTK...")
-    os.system("pip install nltk")
-    import nltk
-    from nltk.tokenize import word_tokenize, sent_tokenize
     from nltk.corpus import stopwords
     from nltk.stem import WordNetLemmatizer
+except ImportError as e:
+    raise ImportError("NLTK required: pip install nltk") from e
+
+
+def bootstrap() -> None:
+    """One-time environment setup for deployments.
+
+    Fetches the NLTK data files that older revisions downloaded
+    implicitly at import time. Run from the deploy pipeline, never from
+    request-serving code.
+    """
+    for dataset in ('punkt', 'stopwords', 'wordnet'):
+        nltk.download(dataset, quiet=True)
+
+# PyMuPDF releases the GIL inside get_text, so multi-page documents extract
+# pages concurrently; set REALTIME_PARALLEL_PAGES=0 to force the serial loop
+_PARALLEL_PAGES = os.getenv('REALTIME_PARALLEL_PAGES', '1') != '0'
+
+# Stop collecting page text once this much has been gathered
+_MAX_EXTRACT_CHARS = 20_000
+
+# Letter grades looked up by bisecting the total score against sorted
+# thresholds instead of walking an if/elif ladder
+_GRADE_THRESH = (60, 65, 70, 75, 80, 85, 90)
+_GRADES = ('C', 'C+', 'B-', 'B', 'B+', 'A-', 'A', 'A+')
+
+_EXP_LEVEL_BONUS = {'senior': 15, 'mid': 10}
+
+
+@lru_cache(maxsize=2048)
+def _score_parts(total_count: int, level_bonus: int, has_leadership: bool,
+                 has_quant: bool, has_action: bool, has_contact: bool,
+                 has_education: bool, has_experience: bool) -> Tuple[int, int, int, int, int, str]:
+    """Pure integer scoring kernel, memoized on its small input space.
+
+    Resumes with the same signal profile share one computation; the
+    caller keeps all text scanning and dict assembly outside.
+    """
+    technical = min(total_count * 3, 40)
+    exp_score = min(15 + level_bonus + (5 if has_leadership else 0), 30)
+    content = 10 + (5 if has_quant else 0) + (5 if has_action else 0)
+    completeness = ((3 if has_contact else 0) + (3 if has_education else 0)
+                    + (4 if has_experience else 0))
+    total = technical + exp_score + content + completeness
+    return technical, exp_score, content, completeness, total, _GRADES[bisect_right(_GRADE_THRESH, total)]
 
-# Download required NLTK data
-required_nltk_data = ['punkt', 'stopwords', 'wordnet']
-for data in required_nltk_data:
+# Role vocabularies for job matching, intersected against the lowercased
+# skill names found in the resume
+_FRONTEND_SKILLS = frozenset({'react', 'angular', 'vue', 'javascript', 'typescript'})
+_BACKEND_SKILLS = frozenset({'python', 'java', 'node.js', 'express', 'django', 'spring'})
+_DATA_SKILLS = frozenset({'python', 'r', 'sql'})
+
+# Static patterns compiled once at import; the scoring and experience paths
+# run them against already-lowercased text every resume. The leadership
+# alternatives carry named groups so one pass counts distinct indicators.
+_LEADERSHIP_RE = re.compile(
+    r'(?P<led>led\s+(?:a\s+)?team)|(?P<managed>managed\s+\d+)|(?P<mentored>mentored)|'
+    r'(?P<supervised>supervised)|(?P<coordinated>coordinated)')
+_LEADERSHIP_GROUPS = 5
+# Disallowed characters and page markers fold into one alternation so the
+# cleaner makes two passes over the text instead of four
+_CLEAN_RE = re.compile(
+    r'page\s+\d+|[^\w\s\.\,\-\@\[\]\{\}\/\\\:\;\!\?\$\%\&\*\+\=\<\>\|\~\`\'\"]',
+    re.IGNORECASE)
+_WS_RE = re.compile(r'\s+')
+
+# The four scoring signals share one tagged alternation; a single scan with
+# an early exit replaces four separate full-text searches
+_SCORE_SIGNALS_RE = re.compile('|'.join((
+    r'(?P<quantifiable>\d+%|\d+\s*years?|\$\d+|increased|improved|reduced)',
+    r'(?P<contact>email|@|phone|\d{3}[-\.\s]?\d{3}[-\.\s]?\d{4})',
+    r'(?P<education>education|degree|university|college|bachelor|master)',
+    r'(?P<experience>experience|employment|work|position)',
+)))
+_SCORE_SIGNAL_COUNT = 4
+
+# Single-word vocabularies are hashed-set lookups against the tokenized
+# text rather than substring scans
+_TOKEN_RE = re.compile(r'\w+')
+_ACTION_VERBS = frozenset({'developed', 'implemented', 'designed', 'led', 'managed', 'created', 'built'})
+
+# Display-name and title tables, built once instead of per call
+_SPECIAL_SKILL_NAMES = {
+    'javascript': 'JavaScript',
+    'typescript': 'TypeScript',
+    'nodejs': 'Node.js',
+    'reactjs': 'React.js',
+    'vuejs': 'Vue.js',
+    'mysql': 'MySQL',
+    'postgresql': 'PostgreSQL',
+    'mongodb': 'MongoDB',
+    'aws': 'AWS',
+    'gcp': 'Google Cloud Platform',
+    'html': 'HTML',
+    'css': 'CSS',
+    'sql': 'SQL',
+    'ci/cd': 'CI/CD'
+}
+
+_JOB_TITLES = {
+    ('software_engineer', 'junior'): 'Junior Software Engineer',
+    ('software_engineer', 'mid'): 'Software Engineer',
+    ('software_engineer', 'senior'): 'Senior Software Engineer',
+    ('frontend_developer', 'junior'): 'Junior Frontend Developer',
+    ('frontend_developer', 'mid'): 'Frontend Developer',
+    ('frontend_developer', 'senior'): 'Senior Frontend Developer',
+    ('backend_developer', 'junior'): 'Junior Backend Developer',
+    ('backend_developer', 'mid'): 'Backend Developer',
+    ('backend_developer', 'senior'): 'Senior Backend Developer',
+    ('fullstack_developer', 'junior'): 'Junior Full-Stack Developer',
+    ('fullstack_developer', 'mid'): 'Full-Stack Developer',
+    ('fullstack_developer', 'senior'): 'Senior Full-Stack Developer',
+    ('devops_engineer', 'junior'): 'DevOps Engineer',
+    ('devops_engineer', 'mid'): 'DevOps Engineer',
+    ('devops_engineer', 'senior'): 'Senior DevOps Engineer',
+    ('data_scientist', 'junior'): 'Junior Data Scientist',
+    ('data_scientist', 'mid'): 'Data Scientist',
+    ('data_scientist', 'senior'): 'Senior Data Scientist'
+}
+
+
+def _pattern_literals(pattern: str) -> List[str]:
+    """Expand a \\b-anchored literal skill regex into plain keyword strings.
+
+    Handles the escapes the skill table actually uses: optional dots fork
+    into both spellings (node.js/nodejs), \\s+ becomes a single space, and
+    escaped characters are unescaped.
+    """
+    bodies = [pattern]
+    while any(r'\.?' in body for body in bodies):
+        expanded = []
+        for body in bodies:
+            if r'\.?' in body:
+                expanded.append(body.replace(r'\.?', '', 1))
+                expanded.append(body.replace(r'\.?', r'\.', 1))
+            else:
+                expanded.append(body)
+        bodies = expanded
+    return [body.replace(r'\b', '').replace(r'\s+', ' ')
+            .replace(r'\.', '.').replace(r'\+', '+')
+            for body in bodies]
+
+
+@lru_cache(maxsize=1)
+def _get_stopwords() -> frozenset:
+    """English stopwords as a cached frozenset, built once per process"""
     try:
-        nltk.data.find(f'tokenizers/{data}')
-    except LookupError:
-        try:
-            nltk.download(data, quiet=True)
-        except Exception as e:
-            logger.warning(f"Could not download {data}: {e}")
+        return frozenset(stopwords.words('english'))
+    except Exception as e:
+        logger.warning("NLTK stopwords unavailable: %s", e)
+        return frozenset()
+
+
+def _is_word_boundary(text: str, start: int, end: int) -> bool:
+    """True when text[start:end] is not embedded in a longer word"""
+    if start > 0 and (text[start - 1].isalnum() or text[start - 1] == '_'):
+        return False
+    if end < len(text) and (text[end].isalnum() or text[end] == '_'):
+        return False
+    return True
 
 class RealtimeResumeAnalyzer:
     def __init__(self):
         self.openai_api_key = os.getenv('NEXT_PUBLIC_OPENAI_API_KEY')
-        
-        # Initialize NLP components
+
+        # Completed analyses keyed by content hash; re-uploads of the same
+        # file (common when users resubmit) skip the whole pipeline
+        self._result_cache: 'OrderedDict[bytes, Dict[str, Any]]' = OrderedDict()
+        self._result_cache_size = 128
+
+        # Parsed PyMuPDF documents keyed by content hash, so re-extracting
+        # the same file skips the parse; evicted handles are closed
+        self._doc_cache: 'OrderedDict[bytes, Any]' = OrderedDict()
+        self._doc_cache_size = 16
+        
+        # Initialize NLP components; the stopword corpus is parsed once per
+        # process instead of per instance
+        self.stop_words = _get_stopwords()
         try:
             self.lemmatizer = WordNetLemmatizer()
-            self.stop_words = set(stopwords.words('english'))
         except Exception as e:
             logger.warning(f"NLTK initialization failed: {e}")
             self.lemmatizer = None
-            self.stop_words = set()
         
         # Real-time skill patterns for instant detection
         self.skill_patterns = {
@@ -161,6 +319,63 @@ class RealtimeResumeAnalyzer:
             'product_manager': [r'\bproduct\s+manager\b', r'\bpm\b', r'\bproduct\s+owner\b']
         }
 
+        # Compile every pattern once; the per-resume loops scan lowercased
+        # text with these instead of re-stringifying through re's cache
+        self._compiled_skill_patterns = {
+            category: {skill: [re.compile(p) for p in patterns]
+                       for skill, patterns in skills.items()}
+            for category, skills in self.skill_patterns.items()
+        }
+        self._compiled_experience = {
+            key: [re.compile(p) for p in patterns]
+            for key, patterns in self.experience_indicators.items()
+        }
+        self._compiled_job_roles = {
+            role: [re.compile(p) for p in patterns]
+            for role, patterns in self.job_role_patterns.items()
+        }
+
+        # Every skill pattern is a literal-word alternation, so they all fold
+        # into one Aho-Corasick automaton and extract_skills_realtime scans
+        # the text once instead of once per pattern
+        keyword_entries: Dict[str, List[Tuple[str, str]]] = {}
+        for category, skills in self.skill_patterns.items():
+            for skill_name, patterns in skills.items():
+                for pattern in patterns:
+                    for keyword in _pattern_literals(pattern):
+                        entries = keyword_entries.setdefault(keyword, [])
+                        if (category, skill_name) not in entries:
+                            entries.append((category, skill_name))
+        self._skill_automaton = ahocorasick.Automaton()
+        for keyword, entries in keyword_entries.items():
+            self._skill_automaton.add_word(keyword, (len(keyword), entries))
+        self._skill_automaton.make_automaton()
+
+    def clear_cache(self):
+        """Close cached document handles and drop memoized results"""
+        while self._doc_cache:
+            _, document = self._doc_cache.popitem(last=False)
+            document.close()
+        self._result_cache.clear()
+
+    @staticmethod
+    def _join_pages(page_texts) -> Tuple[str, bool]:
+        """Join page texts, stopping once enough for analysis has been collected.
+
+        Real-time scoring does not benefit from text beyond the first
+        ~20K characters, so very long documents are truncated rather
+        than extracted in full.
+        """
+        parts = []
+        total = 0
+        for page_text in page_texts:
+            if page_text.strip():
+                parts.append(page_text + "\n")
+                total += len(page_text) + 1
+            if total > _MAX_EXTRACT_CHARS:
+                return "".join(parts), True
+        return "".join(parts), False
+
     def extract_text_realtime(self, pdf_bytes: bytes) -> Tuple[str, Dict[str, Any]]:
         """Fast text extraction optimized for real-time analysis"""
         extraction_info = {
@@ -175,25 +390,51 @@ class RealtimeResumeAnalyzer:
         
         # Try PyMuPDF first (fastest and most reliable)
         try:
-            pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
-            extraction_info['page_count'] = pdf_document.page_count
-            
-            text = ""
-            for page_num in range(pdf_document.page_count):
-                page = pdf_document.load_page(page_num)
-                page_text = page.get_text()
-                if page_text.strip():
-                    text += page_text + "\n"
-            
-            pdf_document.close()
-            
+            doc_key = hashlib.sha256(pdf_bytes).digest()
+            pdf_document = self._doc_cache.get(doc_key)
+            if pdf_document is not None:
+                self._doc_cache.move_to_end(doc_key)
+            else:
+                pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
+                self._doc_cache[doc_key] = pdf_document
+                while len(self._doc_cache) > self._doc_cache_size:
+                    _, evicted = self._doc_cache.popitem(last=False)
+                    evicted.close()
+            page_count = pdf_document.page_count
+            extraction_info['page_count'] = page_count
+
+            if _PARALLEL_PAGES and page_count > 1:
+                with ThreadPoolExecutor(max_workers=min(8, page_count)) as executor:
+                    page_texts = executor.map(
+                        lambda page_num: pdf_document.load_page(page_num).get_text(),
+                        range(page_count))
+                    text, truncated = self._join_pages(page_texts)
+            else:
+                page_texts = (pdf_document.load_page(page_num).get_text()
+                              for page_num in range(page_count))
+                text, truncated = self._join_pages(page_texts)
+
+            # The handle stays open in _doc_cache for reuse; it is closed
+            # when evicted or via clear_cache()
+            if truncated:
+                extraction_info['truncated'] = True
+
             if len(text.strip()) > 100:
                 extraction_info['method'] = 'pymupdf'
                 extraction_info['success'] = True
                 extraction_info['text_length'] = len(text)
                 extraction_info['extraction_time'] = time.time() - start_time
                 return text, extraction_info
-                
+
+            # The document parsed cleanly but has no real text layer — a
+            # scanned PDF. The remaining extractors are also text-layer
+            # readers, so re-parsing the file twice more cannot help;
+            # fail fast instead.
+            extraction_info['method'] = 'scanned_skip_fallback'
+            extraction_info['text_length'] = len(text)
+            extraction_info['extraction_time'] = time.time() - start_time
+            return "", extraction_info
+
         except Exception as e:
             logger.warning(f"PyMuPDF failed: {e}")
         
@@ -201,13 +442,11 @@ class RealtimeResumeAnalyzer:
         try:
             with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
                 extraction_info['page_count'] = len(pdf.pages)
-                text = ""
-                
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-                
+                text, truncated = self._join_pages(
+                    page.extract_text() or "" for page in pdf.pages)
+                if truncated:
+                    extraction_info['truncated'] = True
+
                 if len(text.strip()) > 100:
                     extraction_info['method'] = 'pdfplumber'
                     extraction_info['success'] = True
@@ -222,13 +461,11 @@ class RealtimeResumeAnalyzer:
         try:
             pdf_reader = PyPDF2.PdfReader(BytesIO(pdf_bytes))
             extraction_info['page_count'] = len(pdf_reader.pages)
-            text = ""
-            
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-            
+            text, truncated = self._join_pages(
+                page.extract_text() or "" for page in pdf_reader.pages)
+            if truncated:
+                extraction_info['truncated'] = True
+
             extraction_info['method'] = 'pypdf2'
             extraction_info['success'] = True
             extraction_info['text_length'] = len(text)
@@ -243,21 +480,11 @@ class RealtimeResumeAnalyzer:
 
     def clean_text_fast(self, text: str) -> str:
         """Fast text cleaning for real-time processing"""
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove special characters but keep important ones
-        text = re.sub(r'[^\w\s\.\,\-\@$$$$\[\]\{\}\/\\\:\;\!\?\$\%\&\*\+\=\<\>\|\~\`\'\"]', ' ', text)
-        
-        # Remove page markers
-        text = re.sub(r'page\s+\d+', '', text, flags=re.IGNORECASE)
-        
-        # Clean up multiple spaces
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        # Drop special characters and page markers, then collapse whitespace
+        text = _CLEAN_RE.sub(' ', text)
+        return _WS_RE.sub(' ', text).strip()
 
-    def extract_skills_realtime(self, text: str) -> Dict[str, Any]:
+    def extract_skills_realtime(self, text: str, text_lower: Optional[str] = None) -> Dict[str, Any]:
         """Real-time skill extraction with instant feedback"""
         skills_found = {
             'programming_languages': [],
@@ -271,39 +498,51 @@ class RealtimeResumeAnalyzer:
             'skill_contexts': {}
         }
         
-        text_lower = text.lower()
-        
-        # Extract skills by category
+        if text_lower is None:
+            text_lower = text.lower()
+
+        # One automaton pass counts keyword hits; only the first two offsets
+        # per skill are kept (for context snippets), so a keyword-stuffed
+        # resume repeating "python" hundreds of times costs a counter
+        # increment per hit instead of an unbounded offset list
+        matches_by_skill: Dict[Tuple[str, str], List[Any]] = {}
+        for end_index, (length, entries) in self._skill_automaton.iter(text_lower):
+            start = end_index - length + 1
+            end = end_index + 1
+            if not _is_word_boundary(text_lower, start, end):
+                continue
+            for entry in entries:
+                record = matches_by_skill.get(entry)
+                if record is None:
+                    matches_by_skill[entry] = [1, (start, end)]
+                else:
+                    record[0] += 1
+                    if len(record) < 3:
+                        record.append((start, end))
+
+        # Report per category in the skill table's order
         for category, skills in self.skill_patterns.items():
             category_skills = []
-            
-            for skill_name, patterns in skills.items():
-                skill_found = False
-                total_matches = 0
+
+            for skill_name in skills:
+                record = matches_by_skill.get((category, skill_name))
+                if record is None:
+                    continue
+
+                formatted_skill = self.format_skill_name(skill_name)
+                category_skills.append(formatted_skill)
+
+                # Calculate confidence based on frequency
+                confidence = min(record[0] * 15 + 60, 95)
+                skills_found['confidence_scores'][formatted_skill] = confidence
+
+                # Extract context for first few matches
                 contexts = []
-                
-                for pattern in patterns:
-                    matches = list(re.finditer(pattern, text_lower, re.IGNORECASE))
-                    if matches:
-                        skill_found = True
-                        total_matches += len(matches)
-                        
-                        # Extract context for first few matches
-                        for match in matches[:2]:
-                            start = max(0, match.start() - 30)
-                            end = min(len(text), match.end() + 30)
-                            context = text[start:end].strip()
-                            contexts.append(context)
-                
-                if skill_found:
-                    formatted_skill = self.format_skill_name(skill_name)
-                    category_skills.append(formatted_skill)
-                    
-                    # Calculate confidence based on frequency
-                    confidence = min(total_matches * 15 + 60, 95)
-                    skills_found['confidence_scores'][formatted_skill] = confidence
-                    skills_found['skill_contexts'][formatted_skill] = contexts
-            
+                for start, end in record[1:]:
+                    context = text[max(0, start - 30):min(len(text), end + 30)].strip()
+                    contexts.append(context)
+                skills_found['skill_contexts'][formatted_skill] = contexts
+
             skills_found[category] = category_skills
         
         # Calculate total count
@@ -314,26 +553,10 @@ class RealtimeResumeAnalyzer:
 
     def format_skill_name(self, skill: str) -> str:
         """Format skill names properly"""
-        special_cases = {
-            'javascript': 'JavaScript',
-            'typescript': 'TypeScript',
-            'nodejs': 'Node.js',
-            'reactjs': 'React.js',
-            'vuejs': 'Vue.js',
-            'mysql': 'MySQL',
-            'postgresql': 'PostgreSQL',
-            'mongodb': 'MongoDB',
-            'aws': 'AWS',
-            'gcp': 'Google Cloud Platform',
-            'html': 'HTML',
-            'css': 'CSS',
-            'sql': 'SQL',
-            'ci/cd': 'CI/CD'
-        }
-        
-        return special_cases.get(skill.lower(), skill.title())
+        return _SPECIAL_SKILL_NAMES.get(skill.lower()) or skill.title()
 
-    def analyze_experience_realtime(self, text: str, skills_count: int) -> Dict[str, Any]:
+    def analyze_experience_realtime(self, text: str, skills_count: int,
+                                    text_lower: Optional[str] = None) -> Dict[str, Any]:
         """Real-time experience level analysis"""
         experience_analysis = {
             'level': 'junior',
@@ -343,12 +566,13 @@ class RealtimeResumeAnalyzer:
             'leadership_score': 0,
             'technical_depth': skills_count
         }
-        
-        text_lower = text.lower()
+
+        if text_lower is None:
+            text_lower = text.lower()
         
         # Extract years of experience
-        for pattern in self.experience_indicators['years']:
-            matches = re.findall(pattern, text_lower)
+        for pattern in self._compiled_experience['years']:
+            matches = pattern.findall(text_lower)
             for match in matches:
                 try:
                     years = int(match)
@@ -359,30 +583,25 @@ class RealtimeResumeAnalyzer:
         
         # Check for senior indicators
         senior_count = 0
-        for pattern in self.experience_indicators['senior']:
-            if re.search(pattern, text_lower):
+        for pattern in self._compiled_experience['senior']:
+            if pattern.search(text_lower):
                 senior_count += 1
-                experience_analysis['indicators'].append(f"Senior keyword: {pattern}")
-        
+                experience_analysis['indicators'].append(f"Senior keyword: {pattern.pattern}")
+
         # Check for mid-level indicators
         mid_count = 0
-        for pattern in self.experience_indicators['mid']:
-            if re.search(pattern, text_lower):
+        for pattern in self._compiled_experience['mid']:
+            if pattern.search(text_lower):
                 mid_count += 1
-                experience_analysis['indicators'].append(f"Mid-level keyword: {pattern}")
-        
-        # Leadership indicators
-        leadership_patterns = [
-            r'led\s+(?:a\s+)?team',
-            r'managed\s+\d+',
-            r'mentored',
-            r'supervised',
-            r'coordinated'
-        ]
-        
-        for pattern in leadership_patterns:
-            if re.search(pattern, text_lower):
-                experience_analysis['leadership_score'] += 1
+                experience_analysis['indicators'].append(f"Mid-level keyword: {pattern.pattern}")
+
+        # Leadership indicators: one pass counting distinct named groups
+        leadership_seen = set()
+        for match in _LEADERSHIP_RE.finditer(text_lower):
+            leadership_seen.add(match.lastgroup)
+            if len(leadership_seen) == _LEADERSHIP_GROUPS:
+                break
+        experience_analysis['leadership_score'] = len(leadership_seen)
         
         # Determine level
         max_years = max(experience_analysis['years_found']) if experience_analysis['years_found'] else 0
@@ -414,44 +633,42 @@ class RealtimeResumeAnalyzer:
         
         # Determine primary role based on skills
         role_scores = {}
-        
+
+        # Lowercase each skill name once and score roles by set intersection
+        languages_lower = {skill.lower() for skill in skills['programming_languages']}
+        dev_skills_lower = languages_lower | {skill.lower() for skill in skills['frameworks']}
+
         # Software Engineer
         if skills['programming_languages']:
             role_scores['software_engineer'] = len(skills['programming_languages']) * 10
-        
+
         # Frontend Developer
-        frontend_skills = ['react', 'angular', 'vue', 'javascript', 'typescript']
-        frontend_count = sum(1 for skill in skills['frameworks'] + skills['programming_languages'] 
-                           if any(fs in skill.lower() for fs in frontend_skills))
+        frontend_count = len(dev_skills_lower & _FRONTEND_SKILLS)
         if frontend_count > 0:
             role_scores['frontend_developer'] = frontend_count * 15
-        
+
         # Backend Developer
-        backend_skills = ['python', 'java', 'node.js', 'express', 'django', 'spring']
-        backend_count = sum(1 for skill in skills['frameworks'] + skills['programming_languages'] 
-                          if any(bs in skill.lower() for bs in backend_skills))
+        backend_count = len(dev_skills_lower & _BACKEND_SKILLS)
         if backend_count > 0:
             role_scores['backend_developer'] = backend_count * 15
-        
+
         # Full-stack Developer
         if frontend_count > 0 and backend_count > 0:
             role_scores['fullstack_developer'] = (frontend_count + backend_count) * 12
-        
+
         # DevOps Engineer
         if skills['devops'] or skills['cloud_platforms']:
             role_scores['devops_engineer'] = (len(skills['devops']) + len(skills['cloud_platforms'])) * 20
-        
+
         # Data Scientist
-        data_skills = ['python', 'r', 'sql']
-        data_count = sum(1 for skill in skills['programming_languages'] 
-                        if any(ds in skill.lower() for ds in data_skills))
+        data_count = len(languages_lower & _DATA_SKILLS)
         if data_count > 0:
             role_scores['data_scientist'] = data_count * 18
         
         # Generate matches for top roles
         experience_level = experience['level']
         
-        for role, score in sorted(role_scores.items(), key=lambda x: x[1], reverse=True)[:5]:
+        for role, score in heapq.nlargest(5, role_scores.items(), key=lambda x: x[1]):
             match_percentage = min(score + 40, 95)
             
             salary_ranges = {
@@ -477,40 +694,7 @@ class RealtimeResumeAnalyzer:
 
     def format_job_title(self, role: str, experience_level: str) -> str:
         """Format job titles based on role and experience"""
-        titles = {
-            'software_engineer': {
-                'junior': 'Junior Software Engineer',
-                'mid': 'Software Engineer',
-                'senior': 'Senior Software Engineer'
-            },
-            'frontend_developer': {
-                'junior': 'Junior Frontend Developer',
-                'mid': 'Frontend Developer',
-                'senior': 'Senior Frontend Developer'
-            },
-            'backend_developer': {
-                'junior': 'Junior Backend Developer',
-                'mid': 'Backend Developer',
-                'senior': 'Senior Backend Developer'
-            },
-            'fullstack_developer': {
-                'junior': 'Junior Full-Stack Developer',
-                'mid': 'Full-Stack Developer',
-                'senior': 'Senior Full-Stack Developer'
-            },
-            'devops_engineer': {
-                'junior': 'DevOps Engineer',
-                'mid': 'DevOps Engineer',
-                'senior': 'Senior DevOps Engineer'
-            },
-            'data_scientist': {
-                'junior': 'Junior Data Scientist',
-                'mid': 'Data Scientist',
-                'senior': 'Senior Data Scientist'
-            }
-        }
-        
-        return titles.get(role, {}).get(experience_level, role.replace('_', ' ').title())
+        return _JOB_TITLES.get((role, experience_level)) or role.replace('_', ' ').title()
 
     def get_role_required_skills(self, role: str) -> List[str]:
         """Get required skills for specific roles"""
@@ -525,102 +709,54 @@ class RealtimeResumeAnalyzer:
         
         return role_skills.get(role, ['Programming', 'Problem Solving'])
 
-    def calculate_resume_score_realtime(self, text: str, skills: Dict, experience: Dict) -> Dict[str, Any]:
+    def calculate_resume_score_realtime(self, text: str, skills: Dict, experience: Dict,
+                                        text_lower: Optional[str] = None) -> Dict[str, Any]:
         """Real-time resume scoring"""
-        score_breakdown = {
-            'technical_skills': 0,
-            'experience': 0,
-            'content_quality': 0,
-            'completeness': 0,
-            'total_score': 0,
-            'grade': 'F',
-            'feedback': []
-        }
-        
-        # Technical Skills (40 points)
-        skills_score = min(skills['total_count'] * 3, 40)
-        score_breakdown['technical_skills'] = skills_score
-        
+        if text_lower is None:
+            text_lower = text.lower()
+
+        # Quantifiable/contact/education/experience signals: one tagged scan
+        # over the text with an early exit once every group has fired
+        signals = set()
+        for match in _SCORE_SIGNALS_RE.finditer(text_lower):
+            signals.add(match.lastgroup)
+            if len(signals) == _SCORE_SIGNAL_COUNT:
+                break
+
+        has_quant = 'quantifiable' in signals
+        has_action = not _ACTION_VERBS.isdisjoint(_TOKEN_RE.findall(text_lower))
+
+        # Technical (40) / experience (30) / content (20) / completeness (10)
+        skills_score, exp_score, content_score, completeness_score, total, grade = _score_parts(
+            skills['total_count'],
+            _EXP_LEVEL_BONUS.get(experience['level'], 5),
+            experience['leadership_score'] > 0,
+            has_quant,
+            has_action,
+            'contact' in signals,
+            'education' in signals,
+            'experience' in signals)
+
+        feedback = []
         if skills_score >= 30:
-            score_breakdown['feedback'].append("Excellent technical skill diversity")
+            feedback.append("Excellent technical skill diversity")
         elif skills_score >= 20:
-            score_breakdown['feedback'].append("Good technical skills")
-        else:
-            score_breakdown['feedback'].append("Consider adding more technical skills")
-        
-        # Experience (30 points)
-        exp_score = 15  # Base score
-        if experience['level'] == 'senior':
-            exp_score += 15
-        elif experience['level'] == 'mid':
-            exp_score += 10
+            feedback.append("Good technical skills")
         else:
-            exp_score += 5
-        
-        if experience['leadership_score'] > 0:
-            exp_score += 5
-        
-        score_breakdown['experience'] = min(exp_score, 30)
-        
-        # Content Quality (20 points)
-        content_score = 10  # Base score
-        
-        # Check for quantifiable achievements
-        if re.search(r'\d+%|\d+\s*years?|\$\d+|increased|improved|reduced', text.lower()):
-            content_score += 5
-            score_breakdown['feedback'].append("Good use of quantifiable achievements")
-        
-        # Check for action verbs
-        action_verbs = ['developed', 'implemented', 'designed', 'led', 'managed', 'created', 'built']
-        if any(verb in text.lower() for verb in action_verbs):
-            content_score += 5
-        
-        score_breakdown['content_quality'] = content_score
-        
-        # Completeness (10 points)
-        completeness_score = 0
-        
-        # Check for contact info
-        if re.search(r'email|@|phone|\d{3}[-\.\s]?\d{3}[-\.\s]?\d{4}', text.lower()):
-            completeness_score += 3
-        
-        # Check for education
-        if re.search(r'education|degree|university|college|bachelor|master', text.lower()):
-            completeness_score += 3
-        
-        # Check for experience section
-        if re.search(r'experience|employment|work|position', text.lower()):
-            completeness_score += 4
-        
-        score_breakdown['completeness'] = completeness_score
-        
-        # Calculate total
-        total = (score_breakdown['technical_skills'] + 
-                score_breakdown['experience'] + 
-                score_breakdown['content_quality'] + 
-                score_breakdown['completeness'])
-        
-        score_breakdown['total_score'] = total
-        
-        # Assign grade
-        if total >= 90:
-            score_breakdown['grade'] = 'A+'
-        elif total >= 85:
-            score_breakdown['grade'] = 'A'
-        elif total >= 80:
-            score_breakdown['grade'] = 'A-'
-        elif total >= 75:
-            score_breakdown['grade'] = 'B+'
-        elif total >= 70:
-            score_breakdown['grade'] = 'B'
-        elif total >= 65:
-            score_breakdown['grade'] = 'B-'
-        elif total >= 60:
-            score_breakdown['grade'] = 'C+'
-        else:
-            score_breakdown['grade'] = 'C'
-        
-        return score_breakdown
+            feedback.append("Consider adding more technical skills")
+
+        if has_quant:
+            feedback.append("Good use of quantifiable achievements")
+
+        return {
+            'technical_skills': skills_score,
+            'experience': exp_score,
+            'content_quality': content_score,
+            'completeness': completeness_score,
+            'total_score': total,
+            'grade': grade,
+            'feedback': feedback
+        }
 
     def generate_improvement_suggestions_realtime(self, skills: Dict, experience: Dict, score: Dict) -> List[Dict[str, str]]:
         """Generate real-time improvement suggestions"""
@@ -674,7 +810,15 @@ class RealtimeResumeAnalyzer:
     def analyze_resume_realtime(self, pdf_bytes: bytes, filename: str = "") -> Dict[str, Any]:
         """Main real-time analysis function"""
         start_time = time.time()
-        
+
+        # Same bytes, same answer: serve re-uploads from the cache
+        cache_key = hashlib.sha256(pdf_bytes).digest()
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            self._result_cache.move_to_end(cache_key)
+            logger.info("Realtime analysis cache hit for %s", filename)
+            return copy.deepcopy(cached)
+
         try:
             # Extract text
             extracted_text, extraction_info = self.extract_text_realtime(pdf_bytes)
@@ -682,20 +826,23 @@ class RealtimeResumeAnalyzer:
             if not extraction_info['success'] or len(extracted_text.strip()) < 50:
                 raise ValueError("Could not extract meaningful text from PDF")
             
-            # Clean text
+            # Clean and lowercase once; every stage scans the same copies
             cleaned_text = self.clean_text_fast(extracted_text)
-            
+            cleaned_lower = cleaned_text.lower()
+
             # Extract skills
-            skills_analysis = self.extract_skills_realtime(cleaned_text)
-            
+            skills_analysis = self.extract_skills_realtime(cleaned_text, cleaned_lower)
+
             # Analyze experience
-            experience_analysis = self.analyze_experience_realtime(cleaned_text, skills_analysis['total_count'])
-            
+            experience_analysis = self.analyze_experience_realtime(cleaned_text, skills_analysis['total_count'],
+                                                                   cleaned_lower)
+
             # Generate job matches
             job_matches = self.generate_job_matches_realtime(skills_analysis, experience_analysis)
-            
+
             # Calculate score
-            score_analysis = self.calculate_resume_score_realtime(cleaned_text, skills_analysis, experience_analysis)
+            score_analysis = self.calculate_resume_score_realtime(cleaned_text, skills_analysis, experience_analysis,
+                                                                  cleaned_lower)
             
             # Generate suggestions
             suggestions = self.generate_improvement_suggestions_realtime(skills_analysis, experience_analysis, score_analysis)
@@ -736,8 +883,14 @@ class RealtimeResumeAnalyzer:
                 'analysis_method': 'realtime_python'
             }
             
+            # Cache only successful analyses; callers get their own copy so
+            # mutating a returned result cannot poison later hits
+            self._result_cache[cache_key] = copy.deepcopy(result)
+            while len(self._result_cache) > self._result_cache_size:
+                self._result_cache.popitem(last=False)
+
             return result
-            
+
         except Exception as e:
             logger.error(f"Real-time analysis failed: {str(e)}")
             return {
@@ -747,6 +900,38 @@ class RealtimeResumeAnalyzer:
                 'analysis_method': 'realtime_python_failed'
             }
 
+    def analyze_resumes_batch(self, items: List[Tuple[bytes, str]],
+                              workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Analyze many resumes across worker processes.
+
+        Each resume is an independent CPU-bound job (PDF parse plus
+        pattern matching), so batches scale across cores. Results come
+        back in input order. Small batches run in-process to avoid
+        paying process start-up for nothing.
+        """
+        workers = workers or os.cpu_count() or 1
+        if len(items) <= 1 or workers <= 1:
+            return [self.analyze_resume_realtime(pdf_bytes, filename)
+                    for pdf_bytes, filename in items]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(items) // (workers * 4))
+            return list(executor.map(_analyze_worker, items, chunksize=chunksize))
+
+
+# One analyzer per worker process, built on first use so the pattern
+# compilation and automaton cost is paid once per process, not per resume
+_WORKER_ANALYZER = None
+
+
+def _analyze_worker(item: Tuple[bytes, str]) -> Dict[str, Any]:
+    global _WORKER_ANALYZER
+    if _WORKER_ANALYZER is None:
+        _WORKER_ANALYZER = RealtimeResumeAnalyzer()
+    pdf_bytes, filename = item
+    return _WORKER_ANALYZER.analyze_resume_realtime(pdf_bytes, filename)
+
+
 # Test function
 if __name__ == "__main__":
     analyzer = RealtimeResumeAnalyzer()
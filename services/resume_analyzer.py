@@ -1,143 +1,261 @@
 import os
+import hashlib
 import json
+import logging
 import re
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 import requests
 from io import BytesIO
 
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
 # PDF processing
 try:
-    import PyPDF2
     import pdfplumber
+    import fitz  # PyMuPDF
 except ImportError:
-    print("Installing PDF libraries...")
-    os.system("pip install PyPDF2 pdfplumber")
-    import PyPDF2
+    logger.info("Installing PDF libraries...")
+    os.system("pip install pdfplumber PyMuPDF")
     import pdfplumber
+    import fitz
 
-# Text processing
+# Optional result cache; only used when REDIS_URL is configured
 try:
-    import nltk
-    from nltk.tokenize import word_tokenize, sent_tokenize
-    from nltk.corpus import stopwords
-    from nltk.stem import WordNetLemmatizer
+    import redis
 except ImportError:
-    print("Installing NLTK...")
-    os.system("pip install nltk")
-    import nltk
-    from nltk.tokenize import word_tokenize, sent_tokenize
-    from nltk.corpus import stopwords
-    from nltk.stem import WordNetLemmatizer
-
-# Download required NLTK data
+    redis = None
+
+# Multi-pattern string matching
 try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-    nltk.download('stopwords')
-    nltk.download('wordnet')
-    nltk.download('averaged_perceptron_tagger')
+    import ahocorasick
+except ImportError:
+    logger.info("Installing pyahocorasick...")
+    os.system("pip install pyahocorasick")
+    import ahocorasick
+
+# Keyword vocabularies scanned with substring semantics; they ride along
+# in the skill automaton so scoring, suggestions, and experience-level
+# detection share one pass over the text
+_QUALITY_INDICATORS = (
+    'achieved', 'improved', 'led', 'managed', 'developed', 'implemented',
+    'designed', 'optimized', 'increased', 'reduced', 'created'
+)
+_SENIOR_KEYWORDS = (
+    'senior', 'lead', 'principal', 'architect', 'manager', 'director',
+    'head of', 'vp', 'cto', 'chief', '10+ years', '8+ years', '7+ years'
+)
+_MID_KEYWORDS = (
+    'mid-level', 'intermediate', '3-6 years', '4-7 years', '5+ years'
+)
+_ACHIEVEMENT_WORDS = ('improved', 'increased', 'reduced', 'achieved', 'led')
+_EDUCATION_WORDS = ('bachelor', 'master', 'degree', 'certification', 'certified')
+_PORTFOLIO_WORDS = ('github', 'portfolio', 'project', 'repository')
+
+# Canonical display spellings for skills whose .title() form is wrong
+_SPECIAL_SKILL_NAMES = {
+    'javascript': 'JavaScript',
+    'typescript': 'TypeScript',
+    'nodejs': 'Node.js',
+    'reactjs': 'React.js',
+    'vuejs': 'Vue.js',
+    'angularjs': 'Angular.js',
+    'mysql': 'MySQL',
+    'postgresql': 'PostgreSQL',
+    'mongodb': 'MongoDB',
+    'aws': 'AWS',
+    'gcp': 'Google Cloud Platform',
+    'html': 'HTML',
+    'css': 'CSS',
+    'sql': 'SQL',
+    'api': 'API',
+    'rest': 'REST',
+    'graphql': 'GraphQL'
+}
+
+# Skill databases, shared by every analyzer instance
+_TECHNICAL_SKILLS = {
+    'programming_languages': [
+        'python', 'javascript', 'java', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
+        'swift', 'kotlin', 'scala', 'typescript', 'r', 'matlab', 'perl'
+    ],
+    'web_frameworks': [
+        'react', 'angular', 'vue', 'django', 'flask', 'express', 'spring',
+        'laravel', 'rails', 'asp.net', 'fastapi', 'nestjs', 'svelte'
+    ],
+    'databases': [
+        'mysql', 'postgresql', 'mongodb', 'redis', 'sqlite', 'oracle',
+        'sql server', 'cassandra', 'elasticsearch', 'dynamodb'
+    ],
+    'cloud_platforms': [
+        'aws', 'azure', 'gcp', 'google cloud', 'heroku', 'digitalocean',
+        'vercel', 'netlify', 'firebase'
+    ],
+    'tools_technologies': [
+        'docker', 'kubernetes', 'jenkins', 'git', 'github', 'gitlab',
+        'terraform', 'ansible', 'webpack', 'vite', 'babel'
+    ],
+    'mobile_development': [
+        'react native', 'flutter', 'ionic', 'xamarin', 'android', 'ios'
+    ],
+    'data_science': [
+        'pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch',
+        'keras', 'spark', 'hadoop', 'tableau', 'power bi'
+    ]
+}
+
+_SOFT_SKILLS = [
+    'leadership', 'communication', 'teamwork', 'problem solving',
+    'critical thinking', 'project management', 'time management',
+    'adaptability', 'creativity', 'collaboration', 'analytical skills',
+    'decision making', 'conflict resolution', 'mentoring', 'coaching'
+]
+
+_INDUSTRY_KEYWORDS = {
+    'Agile Development': ['agile', 'scrum', 'kanban', 'sprint'],
+    'DevOps': ['devops', 'ci/cd', 'continuous integration', 'deployment'],
+    'Machine Learning': ['machine learning', 'ml', 'ai', 'artificial intelligence'],
+    'Data Science': ['data science', 'data analysis', 'analytics', 'big data'],
+    'Cybersecurity': ['security', 'cybersecurity', 'encryption', 'penetration testing'],
+    'Cloud Computing': ['cloud', 'serverless', 'microservices', 'containerization'],
+    'Mobile Development': ['mobile', 'app development', 'ios development', 'android development'],
+    'Web Development': ['web development', 'frontend', 'backend', 'full stack'],
+    'UI/UX Design': ['ui', 'ux', 'user experience', 'user interface', 'design'],
+    'Quality Assurance': ['qa', 'testing', 'automation testing', 'unit testing']
+}
+
+# Precompiled patterns; these run on every resume and re's internal
+# cache is small enough to thrash under other regex users
+_WS_RE = re.compile(r'\s+')
+_PUNCT_RE = re.compile(r'[^\w\s\.\,\-$$$$]')
+_NONASCII_RE = re.compile(r'[^\x20-\x7E\n]')
+# The four year-of-experience spellings fused into one alternation,
+# so extraction is a single pass instead of four
+_YEARS_RE = re.compile(
+    r'(?:(\d+)\+?\s*y(?:ea)?rs?\s*(?:of\s*)?(?:experience|exp|in)'
+    r'|experience\D{0,20}?(\d+)\+?\s*years?)'
+)
+# Action verbs counted per occurrence for the quality bonus; the \b
+# guards keep substrings like 'led' in 'knowledge' from counting
+_QUALITY_RE = re.compile(r'\b(?:' + '|'.join(_QUALITY_INDICATORS) + r')\b')
+
+
+@lru_cache(maxsize=1)
+def _build_skill_index() -> Tuple[list, 'ahocorasick.Automaton', Dict[str, str]]:
+    """Build the variant list, automaton, and display table once per process.
+
+    Every ResumeAnalyzer() shares the same structures, so web workers
+    that construct an analyzer per request pay the build cost once, and
+    forked batch workers share them copy-on-write.
+    """
+    tech_variants = []
+    keywords = set()
+    for category, skills in _TECHNICAL_SKILLS.items():
+        for skill in skills:
+            variants = tuple({skill, skill.replace(' ', ''),
+                              skill.replace('-', ' '), skill.replace('.', '')})
+            tech_variants.append((skill, variants))
+            keywords.update(variants)
+    keywords.update(_SOFT_SKILLS)
+    for industry_terms in _INDUSTRY_KEYWORDS.values():
+        keywords.update(industry_terms)
+    keywords.update(_QUALITY_INDICATORS)
+    keywords.update(_SENIOR_KEYWORDS)
+    keywords.update(_MID_KEYWORDS)
+    keywords.update(_ACHIEVEMENT_WORDS)
+    keywords.update(_EDUCATION_WORDS)
+    keywords.update(_PORTFOLIO_WORDS)
+
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+
+    # Display name per known skill, resolved once instead of per match
+    display = {skill: _SPECIAL_SKILL_NAMES.get(skill, skill.title())
+               for skill, _ in tech_variants}
+    return tech_variants, automaton, display
+
 
 class ResumeAnalyzer:
     def __init__(self):
         self.openai_api_key = os.getenv('NEXT_PUBLIC_OPENAI_API_KEY')
         self.huggingface_api_key = os.getenv('NEXT_PUBLIC_HUGGINGFACE_API_KEY')
-        
-        # Initialize NLTK components
-        self.lemmatizer = WordNetLemmatizer()
-        self.stop_words = set(stopwords.words('english'))
-        
-        # Skill databases
-        self.technical_skills = {
-            'programming_languages': [
-                'python', 'javascript', 'java', 'c++', 'c#', 'php', 'ruby', 'go', 'rust', 
-                'swift', 'kotlin', 'scala', 'typescript', 'r', 'matlab', 'perl'
-            ],
-            'web_frameworks': [
-                'react', 'angular', 'vue', 'django', 'flask', 'express', 'spring', 
-                'laravel', 'rails', 'asp.net', 'fastapi', 'nestjs', 'svelte'
-            ],
-            'databases': [
-                'mysql', 'postgresql', 'mongodb', 'redis', 'sqlite', 'oracle', 
-                'sql server', 'cassandra', 'elasticsearch', 'dynamodb'
-            ],
-            'cloud_platforms': [
-                'aws', 'azure', 'gcp', 'google cloud', 'heroku', 'digitalocean', 
-                'vercel', 'netlify', 'firebase'
-            ],
-            'tools_technologies': [
-                'docker', 'kubernetes', 'jenkins', 'git', 'github', 'gitlab', 
-                'terraform', 'ansible', 'webpack', 'vite', 'babel'
-            ],
-            'mobile_development': [
-                'react native', 'flutter', 'ionic', 'xamarin', 'android', 'ios'
-            ],
-            'data_science': [
-                'pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 
-                'keras', 'spark', 'hadoop', 'tableau', 'power bi'
-            ]
-        }
-        
-        self.soft_skills = [
-            'leadership', 'communication', 'teamwork', 'problem solving', 
-            'critical thinking', 'project management', 'time management',
-            'adaptability', 'creativity', 'collaboration', 'analytical skills',
-            'decision making', 'conflict resolution', 'mentoring', 'coaching'
-        ]
+
+        # Redis-backed result cache keyed by PDF content hash; re-uploads
+        # of a byte-identical file skip the whole pipeline
+        self._redis = None
+        redis_url = os.getenv('REDIS_URL')
+        if redis_url and redis is not None:
+            try:
+                self._redis = redis.Redis.from_url(redis_url)
+            except Exception as e:
+                logger.warning("Redis cache unavailable: %s", e)
+
+        # Shared vocabulary and matching structures, built once per process
+        self.technical_skills = _TECHNICAL_SKILLS
+        self.soft_skills = _SOFT_SKILLS
+        self.industry_keywords = _INDUSTRY_KEYWORDS
+        self._tech_variants, self._skill_automaton, self._display = _build_skill_index()
 
     def extract_text_from_pdf(self, pdf_bytes: bytes) -> str:
         """Extract text from PDF using multiple methods for better accuracy"""
-        text = ""
-        
+        # Plain-text payloads (tests simulate PDF bytes this way) skip the
+        # PDF parsers entirely
+        if not pdf_bytes.lstrip()[:5].startswith(b'%PDF'):
+            text = pdf_bytes.decode('utf-8', errors='ignore')
+            text = _NONASCII_RE.sub(' ', text)
+            text = _WS_RE.sub(' ', text)
+            logger.debug("Plain-text extraction yielded %d characters", len(text))
+            return text
+
         try:
-            # Method 1: pdfplumber (better for complex layouts)
-            with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            
+            # Method 1: PyMuPDF (C-backed, fastest). Page parsing releases
+            # the GIL, so multi-page documents extract across threads
+            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+            page_count = doc.page_count
+            if page_count > 1:
+                with ThreadPoolExecutor(max_workers=min(4, page_count)) as executor:
+                    parts = list(executor.map(
+                        lambda page_num: doc.load_page(page_num).get_text("text"),
+                        range(page_count)))
+            else:
+                parts = [page.get_text("text") for page in doc]
+            text = "\n".join(parts)
+            doc.close()
+
             if len(text.strip()) > 100:
-                print(f"Successfully extracted {len(text)} characters using pdfplumber")
+                logger.debug("Successfully extracted %d characters using PyMuPDF", len(text))
                 return text
-                
+
         except Exception as e:
-            print(f"pdfplumber extraction failed: {e}")
-        
+            logger.warning("PyMuPDF extraction failed: %s", e)
+
         try:
-            # Method 2: PyPDF2 (fallback)
-            pdf_reader = PyPDF2.PdfReader(BytesIO(pdf_bytes))
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-            
+            # Method 2: pdfplumber (layout-aware fallback)
+            with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+                text = "\n".join(page.extract_text() or "" for page in pdf.pages)
+
             if len(text.strip()) > 100:
-                print(f"Successfully extracted {len(text)} characters using PyPDF2")
+                logger.debug("Successfully extracted %d characters using pdfplumber", len(text))
                 return text
-                
-        except Exception as e:
-            print(f"PyPDF2 extraction failed: {e}")
-        
-        # Method 3: Simple byte extraction (last resort)
-        try:
-            text = pdf_bytes.decode('utf-8', errors='ignore')
-            # Clean up the text
-            text = re.sub(r'[^\x20-\x7E\n]', ' ', text)
-            text = re.sub(r'\s+', ' ', text)
-            print(f"Fallback extraction yielded {len(text)} characters")
-            return text
+
         except Exception as e:
-            print(f"All extraction methods failed: {e}")
-            return ""
+            logger.warning("pdfplumber extraction failed: %s", e)
+
+        logger.warning("All extraction methods failed")
+        return ""
 
     def preprocess_text(self, text: str) -> str:
         """Clean and preprocess the extracted text"""
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
+        text = _WS_RE.sub(' ', text)
+
         # Remove special characters but keep important punctuation
-        text = re.sub(r'[^\w\s\.\,\-$$$$]', ' ', text)
+        text = _PUNCT_RE.sub(' ', text)
         
         # Remove very short lines (likely artifacts)
         lines = text.split('\n')
@@ -145,41 +263,64 @@ class ResumeAnalyzer:
         
         return '\n'.join(cleaned_lines)
 
-    def extract_skills(self, text: str) -> Dict[str, List[str]]:
+    def _scan_keywords(self, text_lower: str) -> Tuple[set, set]:
+        """Run the automaton once, returning (bounded, unbounded) hit sets.
+
+        Skill extraction consults the boundary-guarded set so hits
+        embedded in a longer word ('go' inside 'mongodb', 'java' inside
+        'javascript') are rejected; scoring and suggestion keywords keep
+        their original substring semantics via the unbounded set.
+        """
+        bounded = set()
+        any_hits = set()
+        text_len = len(text_lower)
+        for end_index, keyword in self._skill_automaton.iter(text_lower):
+            any_hits.add(keyword)
+            start = end_index - len(keyword) + 1
+            if start > 0:
+                prev_char = text_lower[start - 1]
+                if prev_char.isalnum() or prev_char == '_':
+                    continue
+            end = end_index + 1
+            if end < text_len:
+                next_char = text_lower[end]
+                if next_char.isalnum() or next_char == '_':
+                    continue
+            bounded.add(keyword)
+        return bounded, any_hits
+
+    def extract_skills(self, text: str, matched: Optional[set] = None) -> Dict[str, List[str]]:
         """Extract technical and soft skills from resume text"""
-        text_lower = text.lower()
-        
+        # The skill tables are walked in order against the matched set so
+        # output order stays stable
+        if matched is None:
+            matched, _ = self._scan_keywords(text.lower())
+
         found_technical = []
+        seen_technical = set()
         found_soft = []
-        
-        # Extract technical skills
-        for category, skills in self.technical_skills.items():
-            for skill in skills:
-                # Check for exact matches and variations
-                patterns = [
-                    skill,
-                    skill.replace(' ', ''),
-                    skill.replace('-', ' '),
-                    skill.replace('.', '')
-                ]
-                
-                for pattern in patterns:
-                    if pattern in text_lower:
-                        # Capitalize properly
-                        formatted_skill = self.format_skill_name(skill)
-                        if formatted_skill not in found_technical:
-                            found_technical.append(formatted_skill)
-                        break
-        
+        seen_soft = set()
+
+        # Extract technical skills; the seen sets make dedup O(1) instead
+        # of a linear scan of the result list per candidate
+        for skill, variants in self._tech_variants:
+            if any(variant in matched for variant in variants):
+                # Capitalize properly
+                formatted_skill = self._display[skill]
+                if formatted_skill not in seen_technical:
+                    seen_technical.add(formatted_skill)
+                    found_technical.append(formatted_skill)
+
         # Extract soft skills
         for skill in self.soft_skills:
-            if skill in text_lower:
+            if skill in matched:
                 formatted_skill = skill.title()
-                if formatted_skill not in found_soft:
+                if formatted_skill not in seen_soft:
+                    seen_soft.add(formatted_skill)
                     found_soft.append(formatted_skill)
-        
+
         # Industry skills based on context
-        industry_skills = self.extract_industry_skills(text_lower)
+        industry_skills = self.extract_industry_skills(matched)
         
         return {
             'technical': found_technical[:15],  # Limit to top 15
@@ -189,88 +330,37 @@ class ResumeAnalyzer:
 
     def format_skill_name(self, skill: str) -> str:
         """Format skill names properly"""
-        special_cases = {
-            'javascript': 'JavaScript',
-            'typescript': 'TypeScript',
-            'nodejs': 'Node.js',
-            'reactjs': 'React.js',
-            'vuejs': 'Vue.js',
-            'angularjs': 'Angular.js',
-            'mysql': 'MySQL',
-            'postgresql': 'PostgreSQL',
-            'mongodb': 'MongoDB',
-            'aws': 'AWS',
-            'gcp': 'Google Cloud Platform',
-            'html': 'HTML',
-            'css': 'CSS',
-            'sql': 'SQL',
-            'api': 'API',
-            'rest': 'REST',
-            'graphql': 'GraphQL'
-        }
-        
-        return special_cases.get(skill.lower(), skill.title())
+        return _SPECIAL_SKILL_NAMES.get(skill.lower()) or skill.title()
 
-    def extract_industry_skills(self, text: str) -> List[str]:
+    def extract_industry_skills(self, matched_keywords: set) -> List[str]:
         """Extract industry-specific skills and methodologies"""
-        industry_keywords = {
-            'Agile Development': ['agile', 'scrum', 'kanban', 'sprint'],
-            'DevOps': ['devops', 'ci/cd', 'continuous integration', 'deployment'],
-            'Machine Learning': ['machine learning', 'ml', 'ai', 'artificial intelligence'],
-            'Data Science': ['data science', 'data analysis', 'analytics', 'big data'],
-            'Cybersecurity': ['security', 'cybersecurity', 'encryption', 'penetration testing'],
-            'Cloud Computing': ['cloud', 'serverless', 'microservices', 'containerization'],
-            'Mobile Development': ['mobile', 'app development', 'ios development', 'android development'],
-            'Web Development': ['web development', 'frontend', 'backend', 'full stack'],
-            'UI/UX Design': ['ui', 'ux', 'user experience', 'user interface', 'design'],
-            'Quality Assurance': ['qa', 'testing', 'automation testing', 'unit testing']
-        }
-        
         found_industries = []
-        for industry, keywords in industry_keywords.items():
-            if any(keyword in text for keyword in keywords):
+        for industry, keywords in self.industry_keywords.items():
+            if any(keyword in matched_keywords for keyword in keywords):
                 found_industries.append(industry)
-        
+
         return found_industries
 
-    def determine_experience_level(self, text: str) -> str:
+    def determine_experience_level(self, text: str, keyword_hits: Optional[set] = None,
+                                   text_lower: Optional[str] = None) -> str:
         """Determine experience level based on resume content"""
-        text_lower = text.lower()
-        
-        # Senior indicators
-        senior_keywords = [
-            'senior', 'lead', 'principal', 'architect', 'manager', 'director',
-            'head of', 'vp', 'cto', 'chief', '10+ years', '8+ years', '7+ years'
-        ]
-        
-        # Mid-level indicators
-        mid_keywords = [
-            'mid-level', 'intermediate', '3-6 years', '4-7 years', '5+ years'
-        ]
-        
-        # Extract years of experience
-        year_patterns = [
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|exp)',
-            r'(\d+)\+?\s*yrs?\s*(?:of\s*)?(?:experience|exp)',
-            r'experience.*?(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*years?\s*in'
-        ]
-        
-        years_found = []
-        for pattern in year_patterns:
-            matches = re.findall(pattern, text_lower)
-            for match in matches:
-                try:
-                    years_found.append(int(match))
-                except ValueError:
-                    continue
-        
+        if text_lower is None:
+            text_lower = text.lower()
+        if keyword_hits is None:
+            _, keyword_hits = self._scan_keywords(text_lower)
+
+        # Extract years of experience; the regex only captures digit runs,
+        # so no int() guard is needed
+        years_found = [int(group)
+                       for match in _YEARS_RE.finditer(text_lower)
+                       for group in match.groups() if group]
+
         max_years = max(years_found) if years_found else 0
-        
+
         # Decision logic
-        if any(keyword in text_lower for keyword in senior_keywords) or max_years >= 7:
+        if any(keyword in keyword_hits for keyword in _SENIOR_KEYWORDS) or max_years >= 7:
             return 'senior'
-        elif any(keyword in text_lower for keyword in mid_keywords) or 3 <= max_years < 7:
+        elif any(keyword in keyword_hits for keyword in _MID_KEYWORDS) or 3 <= max_years < 7:
             return 'mid'
         else:
             return 'junior'
@@ -361,15 +451,20 @@ class ResumeAnalyzer:
         
         templates = job_templates[experience_level]
         recommendations = []
-        
+
+        # Lowercase the user's skills once; requirements match either a
+        # whole skill name or a word inside a multi-word one
+        user_skills = skills['technical'] + skills['soft'] + skills['industry']
+        user_lower = {skill.lower() for skill in user_skills}
+        user_tokens = {token for skill in user_lower for token in skill.split()}
+
         for template in templates:
             # Calculate match percentage based on skill overlap
             required_skills = template['required_skills']
-            user_skills = skills['technical'] + skills['soft'] + skills['industry']
-            
-            matching_skills = [skill for skill in required_skills 
-                             if any(skill.lower() in user_skill.lower() for user_skill in user_skills)]
-            
+
+            matching_skills = [skill for skill in required_skills
+                               if skill.lower() in user_lower or skill.lower() in user_tokens]
+
             match_percentage = min(85 + len(matching_skills) * 3, 98)
             
             recommendations.append({
@@ -382,10 +477,14 @@ class ResumeAnalyzer:
         
         return recommendations
 
-    def generate_improvement_suggestions(self, text: str, skills: Dict[str, List[str]]) -> List[Dict[str, str]]:
+    def generate_improvement_suggestions(self, text: str, skills: Dict[str, List[str]],
+                                         keyword_hits: Optional[set] = None) -> List[Dict[str, str]]:
         """Generate improvement suggestions based on resume analysis"""
+        if keyword_hits is None:
+            _, keyword_hits = self._scan_keywords(text.lower())
+
         suggestions = []
-        
+
         # Skills suggestions
         if len(skills['technical']) < 5:
             suggestions.append({
@@ -395,7 +494,7 @@ class ResumeAnalyzer:
             })
         
         # Experience presentation
-        if not any(word in text.lower() for word in ['improved', 'increased', 'reduced', 'achieved', 'led']):
+        if not any(word in keyword_hits for word in _ACHIEVEMENT_WORDS):
             suggestions.append({
                 'category': 'experience',
                 'suggestion': 'Include quantifiable achievements with specific metrics (e.g., "Improved performance by 30%", "Led team of 5 developers").',
@@ -403,7 +502,7 @@ class ResumeAnalyzer:
             })
         
         # Education and certifications
-        if not any(word in text.lower() for word in ['bachelor', 'master', 'degree', 'certification', 'certified']):
+        if not any(word in keyword_hits for word in _EDUCATION_WORDS):
             suggestions.append({
                 'category': 'format',
                 'suggestion': 'Consider adding your educational background and relevant certifications to strengthen your profile.',
@@ -411,7 +510,7 @@ class ResumeAnalyzer:
             })
         
         # Portfolio and projects
-        if not any(word in text.lower() for word in ['github', 'portfolio', 'project', 'repository']):
+        if not any(word in keyword_hits for word in _PORTFOLIO_WORDS):
             suggestions.append({
                 'category': 'format',
                 'suggestion': 'Include links to your GitHub profile, portfolio, or notable projects to showcase your work.',
@@ -480,63 +579,116 @@ class ResumeAnalyzer:
         
         return questions[:8]  # Limit to 8 questions
 
-    def calculate_overall_score(self, skills: Dict[str, List[str]], experience_level: str, text: str) -> int:
+    def calculate_overall_score(self, skills: Dict[str, List[str]], experience_level: str,
+                                text: str, text_lower: Optional[str] = None) -> int:
         """Calculate an overall resume score"""
+        if text_lower is None:
+            text_lower = text.lower()
+
         score = 70  # Base score
-        
+
         # Skills diversity bonus
         total_skills = len(skills['technical']) + len(skills['soft']) + len(skills['industry'])
         score += min(total_skills * 1.5, 25)
-        
+
         # Experience level bonus
         if experience_level == 'senior':
             score += 15
         elif experience_level == 'mid':
             score += 10
-        
-        # Content quality indicators
-        quality_indicators = [
-            'achieved', 'improved', 'led', 'managed', 'developed', 'implemented',
-            'designed', 'optimized', 'increased', 'reduced', 'created'
-        ]
-        
-        quality_score = sum(1 for indicator in quality_indicators if indicator in text.lower())
+
+        # Content quality indicators, counted per occurrence
+        quality_score = len(_QUALITY_RE.findall(text_lower))
         score += min(quality_score * 2, 15)
-        
+
         return min(max(score, 0), 100)
 
-    def analyze_resume(self, pdf_bytes: bytes, filename: str = "") -> Dict[str, Any]:
-        """Main analysis function that processes a resume PDF"""
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached analysis; cache errors never fail the request"""
+        if self._redis is None:
+            return None
         try:
-            print(f"Starting analysis of {filename}")
-            
+            cached = self._redis.get(key)
+        except Exception as e:
+            logger.warning("Redis get failed: %s", e)
+            return None
+        if cached is None:
+            return None
+        result = json.loads(cached)
+        result['cache_hit'] = True
+        return result
+
+    def _cache_set(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a successful analysis for 24 hours"""
+        if self._redis is None:
+            return
+        try:
+            self._redis.setex(key, 3600 * 24, json.dumps(result))
+        except Exception as e:
+            logger.warning("Redis set failed: %s", e)
+
+    def analyze_resume(self, pdf_bytes: bytes, filename: str = "",
+                       include_text: bool = False) -> Dict[str, Any]:
+        """Main analysis function that processes a resume PDF.
+
+        The full and cleaned text blobs are included only when
+        include_text is set; the default summary result is much smaller
+        to serialize and cache. Summary and full results are cached
+        under separate keys.
+        """
+        cache_key = "resume:" + hashlib.sha256(pdf_bytes).hexdigest()
+        if include_text:
+            cache_key += ":full"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info("Cache hit for %s", filename)
+            return cached
+
+        try:
+            logger.info("Starting analysis of %s", filename)
+
             # Extract text from PDF
             extracted_text = self.extract_text_from_pdf(pdf_bytes)
             
             if len(extracted_text.strip()) < 50:
                 raise ValueError("Could not extract meaningful text from PDF")
             
-            print(f"Extracted {len(extracted_text)} characters from PDF")
+            logger.debug("Extracted %d characters from PDF", len(extracted_text))
             
             # Preprocess text
             cleaned_text = self.preprocess_text(extracted_text)
-            
+
+            # Lowercase once; the automaton pass and year extraction reuse it
+            cleaned_lower = cleaned_text.lower()
+
+            # One automaton pass serves skill extraction, experience-level
+            # detection, suggestions, and scoring
+            matched, keyword_hits = self._scan_keywords(cleaned_lower)
+
             # Extract skills
-            skills = self.extract_skills(cleaned_text)
-            print(f"Found {len(skills['technical'])} technical skills, {len(skills['soft'])} soft skills")
-            
+            skills = self.extract_skills(cleaned_text, matched)
+            logger.debug("Found %d technical skills, %d soft skills", len(skills['technical']), len(skills['soft']))
+
             # Determine experience level
-            experience_level = self.determine_experience_level(cleaned_text)
-            print(f"Determined experience level: {experience_level}")
-            
+            experience_level = self.determine_experience_level(cleaned_text, keyword_hits, cleaned_lower)
+            logger.debug("Determined experience level: %s", experience_level)
+
             # Generate recommendations
             job_recommendations = self.generate_job_recommendations(skills, experience_level)
-            improvement_suggestions = self.generate_improvement_suggestions(cleaned_text, skills)
+            improvement_suggestions = self.generate_improvement_suggestions(cleaned_text, skills, keyword_hits)
             interview_questions = self.generate_interview_questions(skills, experience_level)
-            
+
             # Calculate overall score
-            overall_score = self.calculate_overall_score(skills, experience_level, cleaned_text)
-            
+            overall_score = self.calculate_overall_score(skills, experience_level, cleaned_text, cleaned_lower)
+
+            extracted_data = {
+                'textLength': len(extracted_text),
+                'filename': filename
+            }
+            if include_text:
+                extracted_data['fullText'] = extracted_text
+                extracted_data['cleanedText'] = cleaned_text
+
             result = {
                 'skills': skills,
                 'experience_level': experience_level,
@@ -544,22 +696,50 @@ class ResumeAnalyzer:
                 'improvement_suggestions': improvement_suggestions,
                 'interview_questions': interview_questions,
                 'overall_score': overall_score,
-                'extracted_data': {
-                    'fullText': extracted_text,
-                    'cleanedText': cleaned_text,
-                    'textLength': len(extracted_text),
-                    'filename': filename
-                },
+                'extracted_data': extracted_data,
                 'analysis_method': 'python_advanced'
             }
             
-            print(f"Analysis completed successfully. Score: {overall_score}")
+            logger.info("Analysis completed successfully. Score: %d", overall_score)
+            self._cache_set(cache_key, result)
             return result
             
         except Exception as e:
-            print(f"Analysis failed: {str(e)}")
+            logger.error("Analysis failed: %s", e)
             raise e
 
+    def analyze_resumes_batch(self, items: List[Tuple[bytes, str]],
+                              workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Analyze many resumes across worker processes.
+
+        Each resume is an independent CPU-bound job (PDF parse plus skill
+        matching), so batches scale roughly linearly with cores. Results
+        come back in input order. Single-item batches, or workers=1, run
+        in-process to avoid pool start-up cost.
+        """
+        workers = workers or os.cpu_count() or 1
+        if len(items) <= 1 or workers <= 1:
+            return [self.analyze_resume(pdf_bytes, filename)
+                    for pdf_bytes, filename in items]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(items) // (workers * 4))
+            return list(executor.map(_analyze_worker, items, chunksize=chunksize))
+
+
+# One analyzer per worker process, built on first use so the skill tables
+# and automaton are constructed once per process, not per resume
+_WORKER_ANALYZER = None
+
+
+def _analyze_worker(item: Tuple[bytes, str]) -> Dict[str, Any]:
+    global _WORKER_ANALYZER
+    if _WORKER_ANALYZER is None:
+        _WORKER_ANALYZER = ResumeAnalyzer()
+    pdf_bytes, filename = item
+    return _WORKER_ANALYZER.analyze_resume(pdf_bytes, filename)
+
+
 # Test the analyzer
 if __name__ == "__main__":
     analyzer = ResumeAnalyzer()